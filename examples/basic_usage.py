@@ -2,7 +2,9 @@
 pydantic-htmx の使用例
 """
 
+import re
 from datetime import date
+from pathlib import Path
 from typing import Literal, Annotated
 
 from pydantic import BaseModel, Field
@@ -16,6 +18,10 @@ from pydantic_htmx import (
 from pydantic_htmx.field_types import Select
 
 
+# メールアドレスのパターン（モジュール読み込み時に一度だけコンパイル）
+_EMAIL_RE = re.compile(r"^[\w.+-]+@[\w-]+(\.[\w-]+)+$")
+
+
 # 基本的なモデル定義
 class UserRegistration(BaseModel):
     """ユーザー登録フォーム"""
@@ -33,7 +39,7 @@ class UserRegistration(BaseModel):
     email: Annotated[
         str,
         Field(
-            pattern=r"^[\w\.-]+@[\w\.-]+\.\w+$",
+            pattern=_EMAIL_RE.pattern,
             title="メールアドレス",
             description="有効なメールアドレスを入力してください",
         ),
@@ -102,13 +108,15 @@ class ProductOrder(BaseModel):
 def main():
     """使用例のデモ"""
 
+    # モデルの解析は生成時に一度だけ行われるので、ジェネレーターは先に作って使い回す
+    user_form = FormGenerator(UserRegistration, validate_endpoint="/api/validate/user")
+    order_form = FormGenerator(ProductOrder, validate_endpoint="/api/validate/order")
+
     # ユーザー登録フォームの生成
     print("=" * 60)
     print("ユーザー登録フォーム")
     print("=" * 60)
 
-    user_form = FormGenerator(UserRegistration, validate_endpoint="/api/validate/user")
-
     # フォームHTMLを生成
     html = user_form.generate_form(action="/api/register", submit_text="登録する")
     print(html)
@@ -121,19 +129,20 @@ def main():
 
     validator = user_form.get_validator()
 
+    # validate_field はフォーム全体のデータを受け取る
     # 有効なデータ
-    result = validator.validate_field("username", "john_doe")
+    result = validator.validate_field("username", {"username": "john_doe"})
     print(f"username='john_doe': {result.to_html()}")
 
     # 無効なデータ（短すぎる）
-    result = validator.validate_field("username", "ab")
+    result = validator.validate_field("username", {"username": "ab"})
     print(f"username='ab': {result.to_html()}")
 
     # 年齢の検証
-    result = validator.validate_field("age", 25)
+    result = validator.validate_field("age", {"age": 25})
     print(f"age=25: {result.to_html()}")
 
-    result = validator.validate_field("age", 15)
+    result = validator.validate_field("age", {"age": 15})
     print(f"age=15: {result.to_html()}")
 
     print()
@@ -143,16 +152,13 @@ def main():
     print("商品注文フォーム")
     print("=" * 60)
 
-    order_form = FormGenerator(ProductOrder, validate_endpoint="/api/validate/order")
-
     # 完全なHTMLドキュメントを生成
     full_html = order_form.generate_full_html(
         title="商品注文", action="/api/order", submit_text="注文する"
     )
 
     # ファイルに保存
-    with open("order_form.html", "w", encoding="utf-8") as f:
-        f.write(full_html)
+    Path("order_form.html").write_text(full_html, encoding="utf-8")
 
     print("order_form.html に保存しました")
     print()
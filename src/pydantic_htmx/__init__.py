@@ -8,7 +8,7 @@ from .field_types import (
     CheckboxField,
     DateField,
 )
-from .validators import HTMXValidator
+from .validators import HTMXValidator, get_validator
 from .form_data import (
     FormDataParser,
     parse_form_data,
@@ -21,6 +21,7 @@ __all__ = [
     "CheckboxField",
     "DateField",
     "HTMXValidator",
+    "get_validator",
     "FormDataParser",
     "parse_form_data",
     "parse_form_data_safe",
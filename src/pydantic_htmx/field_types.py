@@ -3,40 +3,60 @@
 選択肢、チェックボックス、日付などの特殊なフィールドタイプを定義
 """
 
-from typing import Annotated, Any, Sequence
+from typing import Any, Sequence
 from dataclasses import dataclass
+from datetime import date
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
 
-@dataclass
+# 各フィールドタイプのコアスキーマ（スキーマ構築のたびに生成しないよう共有する）
+# Pydanticがスキーマを書き換えても共有側に影響しないよう、浅いコピーを返す
+_STR_SCHEMA = core_schema.str_schema()
+_BOOL_SCHEMA = core_schema.bool_schema()
+_DATE_SCHEMA = core_schema.date_schema()
+
+
+@dataclass(slots=True)
 class SelectOption:
     """選択肢のオプションを定義するクラス"""
 
     value: str
-    label: str
+    label: str | None = None
 
-    def __init__(self, value: str, label: str | None = None):
-        self.value = value
-        self.label = label if label is not None else value
+    def __post_init__(self):
+        # ラベル省略時は値をそのままラベルとして使う
+        if self.label is None:
+            self.label = self.value
 
 
 class SelectField:
     """選択肢フィールドのマーカークラス"""
 
     def __init__(self, options: Sequence[SelectOption | str]):
-        self.options: list[SelectOption] = []
-        for opt in options:
-            if isinstance(opt, str):
-                self.options.append(SelectOption(opt, opt))
-            else:
-                self.options.append(opt)
+        # 渡された選択肢を後から変更されても影響しないよう、コピーを持つ
+        self._options: tuple[SelectOption, ...] = tuple(
+            (
+                SelectOption(opt, opt)
+                if isinstance(opt, str)
+                else SelectOption(opt.value, opt.label)
+            )
+            for opt in options
+        )
+
+    @property
+    def options(self) -> list[SelectOption]:
+        """選択肢のリスト
+
+        Select()の型は同じ選択肢を持つモデル間で共有されるため、呼び出しごとにコピーを返す
+        """
+        return [SelectOption(opt.value, opt.label) for opt in self._options]
 
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> CoreSchema:
-        return core_schema.str_schema()
+        return _STR_SCHEMA.copy()
 
 
 class CheckboxField:
@@ -46,7 +66,7 @@ class CheckboxField:
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> CoreSchema:
-        return core_schema.bool_schema()
+        return _BOOL_SCHEMA.copy()
 
 
 class DateField:
@@ -56,48 +76,72 @@ class DateField:
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> CoreSchema:
-        return core_schema.date_schema()
+        return _DATE_SCHEMA.copy()
+
+
+class _SelectStr(str):
+    """Select()が返す選択肢型の基底クラス"""
+
+    _select_field: SelectField
+    _options: tuple[SelectOption, ...]
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return _STR_SCHEMA.copy()
+
+
+# 選択肢の(値, ラベル)タプル → 生成済みの選択肢型
+_SELECT_TYPES: dict[tuple[tuple[str, str | None], ...], type[_SelectStr]] = {}
 
 
 def Select(options: Sequence[SelectOption | str]) -> type:
-    """選択肢フィールドを作成するファクトリ関数"""
+    """選択肢フィールドを作成するファクトリ関数
+
+    同じ選択肢に対しては同じ型を返す
+    （型の選択肢は変更できないタプルで、利用側はコピーして使う）
+    """
     field = SelectField(options)
+    key = tuple((opt.value, opt.label) for opt in field._options)
 
-    class SelectType(str):
-        _select_field = field
-        _options = field.options
+    select_type = _SELECT_TYPES.get(key)
+    if select_type is None:
+        select_type = type(
+            "SelectType",
+            (_SelectStr,),
+            {"_select_field": field, "_options": field._options},
+        )
+        _SELECT_TYPES[key] = select_type
 
-        @classmethod
-        def __get_pydantic_core_schema__(
-            cls, source_type: Any, handler: GetCoreSchemaHandler
-        ) -> CoreSchema:
-            return core_schema.str_schema()
+    return select_type
 
-    return SelectType
 
+class _CheckboxType:
+    """Checkbox()が返すチェックボックス型"""
 
-def Checkbox() -> type:
-    """チェックボックスフィールドを作成するファクトリ関数"""
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return _BOOL_SCHEMA.copy()
 
-    class CheckboxType:
-        @classmethod
-        def __get_pydantic_core_schema__(
-            cls, source_type: Any, handler: GetCoreSchemaHandler
-        ) -> CoreSchema:
-            return core_schema.bool_schema()
 
-    return CheckboxType
+class _DateType(date):
+    """Date()が返す日付型"""
 
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return _DATE_SCHEMA.copy()
 
-def Date() -> type:
-    """日付フィールドを作成するファクトリ関数"""
-    from datetime import date as date_type
 
-    class DateType(date_type):
-        @classmethod
-        def __get_pydantic_core_schema__(
-            cls, source_type: Any, handler: GetCoreSchemaHandler
-        ) -> CoreSchema:
-            return core_schema.date_schema()
+def Checkbox() -> type:
+    """チェックボックスフィールドを作成するファクトリ関数"""
+    return _CheckboxType
 
-    return DateType
+
+def Date() -> type:
+    """日付フィールドを作成するファクトリ関数"""
+    return _DateType
@@ -2,11 +2,214 @@
 フォームデータをPydanticモデルに変換するモジュール
 """
 
-from typing import Any, get_args, get_origin
+import re
+import sys
+from types import UnionType
+from typing import Any, Callable, Literal, Union, get_args, get_origin
 from datetime import date
 from pydantic import BaseModel, ValidationError
 
+from .field_types import _SelectStr
 from .parser import ModelParser, FieldType
+from .validators import _FLOAT_RE, _INT_RE, _supports_fast_checks
+
+
+# <input type="date"> が送信するYYYY-MM-DD形式
+_ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# フォームデータにキーが存在しないことを表す番兵
+_MISSING = object()
+
+# チェックボックスでTrueとして扱う値（よく使われる大文字表記も含め、lower()を省く）
+_TRUE_VALUES = frozenset(
+    {"on", "true", "1", "yes", "checked", "On", "TRUE", "True", "Yes"}
+)
+
+
+def _to_bool(value: Any) -> bool:
+    """真偽値に変換（チェックボックスは "on", "true", "1" などで送信される）"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        if value in _TRUE_VALUES:
+            return True
+        return value.lower() in _TRUE_VALUES
+    return bool(value)
+
+
+def _to_date(value: Any) -> Any:
+    """ISO形式の日付文字列を日付に変換
+
+    <input type="date">の送信するYYYY-MM-DD形式を先に判定し、
+    それ以外のISO形式（20240101など）はdate.fromisoformatに任せる
+    （変換できない場合はValueError/TypeErrorを送出する）
+    """
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and _ISO_DATE_RE.fullmatch(value):
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return date.fromisoformat(value)
+
+
+# フィールドタイプ → 変換関数（失敗時はValueError/TypeErrorを送出）
+# 選択肢はそのまま文字列として扱う
+_CONVERTERS: dict[FieldType, Callable[[Any], Any]] = {
+    FieldType.INTEGER: int,
+    FieldType.FLOAT: float,
+    FieldType.CHECKBOX: _to_bool,
+    FieldType.BOOLEAN: _to_bool,
+    FieldType.DATE: _to_date,
+    FieldType.SELECT: str,
+    FieldType.STRING: str,
+}
+
+# エラータイプ → 日本語メッセージ
+_STATIC_TRANSLATIONS: dict[str, str] = {
+    "string_too_short": "この値は短すぎます",
+    "string_too_long": "この値は長すぎます",
+    "value_error": "値が無効です",
+    "type_error": "型が正しくありません",
+    "missing": "このフィールドは必須です",
+    "int_parsing": "整数を入力してください",
+    "float_parsing": "数値を入力してください",
+    "bool_parsing": "真偽値を入力してください",
+    "date_parsing": "有効な日付を入力してください",
+    "date_from_datetime_parsing": "有効な日付を入力してください",
+    "string_pattern_mismatch": "パターンに一致しません",
+}
+
+# エラータイプ → (ctxのキー, メッセージのフォーマッタ)
+_BOUND_TRANSLATIONS: dict[str, tuple[str, Callable[[Any], str]]] = {
+    "greater_than_equal": ("ge", "この値は{}以上である必要があります".format),
+    "less_than_equal": ("le", "この値は{}以下である必要があります".format),
+    "greater_than": ("gt", "この値は{}より大きい必要があります".format),
+    "less_than": ("lt", "この値は{}より小さい必要があります".format),
+}
+
+
+def _make_converter(parsed_field: Any) -> Callable[[Any], Any]:
+    """フィールド専用の値の変換関数を生成
+
+    必須かどうかと変換関数を生成時に決めておき、値ごとの分岐を減らす
+    """
+    required = parsed_field.required
+    coerce = _CONVERTERS.get(parsed_field.field_type)
+
+    def convert(value: Any) -> Any:
+        # 空文字列の処理
+        if value == "" or value is None:
+            # 必須の場合はそのまま渡し、Pydanticにバリデーションエラーを出させる
+            return value if required else None
+        if coerce is None:
+            return value
+        try:
+            return coerce(value)
+        except (ValueError, TypeError):
+            # 変換に失敗した場合は元の値を返し、Pydanticにバリデーションを任せる
+            return value
+
+    return convert
+
+
+# trusted=TrueでFalseとして扱うチェックボックスの値（未知の文字列はバリデーションに任せる）
+_FALSE_VALUES = frozenset({"off", "false", "0", "no", "Off", "FALSE", "False", "No"})
+
+
+def _trusted_str(value: Any) -> str:
+    if type(value) is str:
+        return value
+    raise ValueError(value)
+
+
+def _trusted_int(value: Any) -> int:
+    if type(value) is int:
+        return value
+    if type(value) is str and _INT_RE.fullmatch(value):
+        return int(value)
+    raise ValueError(value)
+
+
+def _trusted_float(value: Any) -> float:
+    if type(value) is float or type(value) is int:
+        return float(value)
+    if type(value) is str and _FLOAT_RE.fullmatch(value):
+        return float(value)
+    raise ValueError(value)
+
+
+def _trusted_bool(value: Any) -> bool:
+    if type(value) is bool:
+        return value
+    if type(value) is str:
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+    raise ValueError(value)
+
+
+def _trusted_date(value: Any) -> date:
+    if type(value) is date:
+        return value
+    if type(value) is str:
+        return _to_date(value)
+    raise ValueError(value)
+
+
+# 型 → trusted=Trueでの変換関数
+# 型の一致する値と、想定どおりの形式の文字列のみを変換し、それ以外はValueErrorを送出する
+_TRUSTED_CONVERTERS: dict[Any, Callable[[Any], Any]] = {
+    str: _trusted_str,
+    int: _trusted_int,
+    float: _trusted_float,
+    bool: _trusted_bool,
+    date: _trusted_date,
+}
+
+
+def _make_trusted_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """trusted=Trueでバリデーションを省略できるフィールドの変換関数を生成
+
+    str・int・float・bool・date・Literal・Select()の型（とそのOptional）のみを対象とし、
+    それ以外の型（リストや入れ子のモデルなど）の場合はNoneを返す
+    """
+    origin = get_origin(annotation)
+    if origin is Union or isinstance(annotation, UnionType):
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+        origin = get_origin(annotation)
+
+    if origin is Literal:
+        choices = get_args(annotation)
+
+        def convert_literal(value: Any) -> Any:
+            # True == 1 のような型の異なる一致は認めない
+            for choice in choices:
+                if type(choice) is type(value) and choice == value:
+                    return choice
+            raise ValueError(value)
+
+        return convert_literal
+
+    if isinstance(annotation, type) and issubclass(annotation, _SelectStr):
+        return _trusted_str
+    return _TRUSTED_CONVERTERS.get(annotation)
+
+
+def _missing_error_key(name: str, field_info: Any) -> str | None:
+    """必須フィールドの欠落時にPydanticがエラーのlocに使うキー
+
+    文字列の別名があればその別名、なければフィールド名
+    AliasChoicesやAliasPathの場合は判定しない（Noneを返す）
+    """
+    alias = field_info.validation_alias
+    if alias is None:
+        return name
+    if isinstance(alias, str):
+        return alias
+    return None
 
 
 class FormDataParser:
@@ -18,14 +221,58 @@ class FormDataParser:
             model: Pydanticモデルクラス
         """
         self.model = model
-        self.fields = {f.name: f for f in ModelParser.parse(model)}
-
-    def parse(self, form_data: dict[str, Any]) -> BaseModel:
+        # フィールド名をインターンしておくと、同じくインターン済みのキーを持つ
+        # フォームデータとの辞書検索がポインタ比較で済む
+        self.fields = {sys.intern(f.name): f for f in ModelParser.parse(model)}
+        # 変換ループで毎回dictビューを生成しないようにタプル化しておく
+        self._field_items = tuple(self.fields.items())
+        # フィールド名 → フィールド専用の変換関数（型による分岐を生成時に済ませる）
+        self._converters = {name: _make_converter(f) for name, f in self._field_items}
+        # (フィールド名, 変換関数, チェックボックスか) のフィールド定義順
+        self._convert_plan = tuple(
+            (name, self._converters[name], f.field_type is FieldType.CHECKBOX)
+            for name, f in self._field_items
+        )
+        # フィールド名 → trusted=Trueでの変換関数
+        # バリデーションを省略できない型のフィールドがある場合はNone
+        trusted_converters = {
+            name: _make_trusted_converter(model.model_fields[name].annotation)
+            for name in self.fields
+        }
+        self._trusted_converters = (
+            None
+            if any(convert is None for convert in trusted_converters.values())
+            else trusted_converters
+        )
+        # (必須フィールド名, 欠落時にPydanticがエラーのlocに使うキー)
+        # locを事前に決められない別名（AliasChoicesなど）がある場合や、
+        # バリデーターなどが他のキーから値を補いうるモデルの場合はNone
+        required_keys = tuple(
+            (name, _missing_error_key(name, model.model_fields[name]))
+            for name, f in self.fields.items()
+            if f.required
+        )
+        self._required_keys = (
+            required_keys
+            if _supports_fast_checks(model)
+            and all(key is not None for _, key in required_keys)
+            else None
+        )
+        # 未送信時にFalseを補う必要があるチェックボックスフィールド
+        self._checkbox_names = frozenset(
+            name
+            for name, f in self.fields.items()
+            if f.field_type is FieldType.CHECKBOX
+        )
+
+    def parse(self, form_data: dict[str, Any], trusted: bool = False) -> BaseModel:
         """
         フォームデータをPydanticモデルに変換
 
         Args:
             form_data: フォームから送信されたデータ（通常は文字列の辞書）
+            trusted: Trueの場合、すべての値が型変換できればバリデーションを省略して
+                model_constructで構築する（信頼できる入力にのみ使用すること）
 
         Returns:
             パース済みのPydanticモデルインスタンス
@@ -33,6 +280,11 @@ class FormDataParser:
         Raises:
             ValidationError: バリデーションエラーが発生した場合
         """
+        if trusted:
+            model = self._construct_trusted(form_data)
+            if model is not None:
+                return model
+
         converted_data = self._convert_form_data(form_data)
         return self.model.model_validate(converted_data)
 
@@ -49,9 +301,21 @@ class FormDataParser:
             (モデルインスタンス or None, エラー辞書)のタプル
             成功時はモデルインスタンスと空の辞書
             失敗時はNoneとフィールド名→エラーメッセージの辞書
+            モデルのフィールドが一つも送信されていない場合は、必須フィールドのエラーのみを返す
         """
+        converted_data = self._convert_form_data(form_data)
+
+        # 何も送信されていなければ、必須フィールドの欠落はPydanticを呼ばずに返す
+        # （他の値がある場合は、その制約エラーも合わせて返すためPydanticに任せる）
+        # エラーのキーはPydanticと同じくlocの先頭（別名がある場合は別名）
+        required_keys = self._required_keys
+        if required_keys is not None and form_data.keys().isdisjoint(self.fields):
+            missing = [key for name, key in required_keys if name not in converted_data]
+            if missing:
+                return None, {key: _STATIC_TRANSLATIONS["missing"] for key in missing}
+
         try:
-            model = self.parse(form_data)
+            model = self.model.model_validate(converted_data)
             return model, {}
         except ValidationError as e:
             errors: dict[str, str] = {}
@@ -65,93 +329,97 @@ class FormDataParser:
         """フォームデータを適切な型に変換"""
         converted: dict[str, Any] = {}
 
-        for field_name, parsed_field in self.fields.items():
-            if field_name not in form_data:
+        if not self._checkbox_names:
+            # 補完すべきフィールドがないため、送信されたキーだけを変換すればよい
+            converters = self._converters
+            for field_name, value in form_data.items():
+                convert = converters.get(field_name)
+                if convert is not None:
+                    converted[field_name] = convert(value)
+            return converted
+
+        for field_name, convert, is_checkbox in self._convert_plan:
+            value = form_data.get(field_name, _MISSING)
+            if value is _MISSING:
                 # フィールドが存在しない場合
                 # チェックボックスは未チェック時に送信されないためFalseとして扱う
-                if parsed_field.field_type == FieldType.CHECKBOX:
+                if is_checkbox:
                     converted[field_name] = False
                 continue
 
-            value = form_data[field_name]
-            converted_value = self._convert_value(value, parsed_field)
-            converted[field_name] = converted_value
+            converted[field_name] = convert(value)
 
         return converted
 
-    def _convert_value(self, value: Any, parsed_field: Any) -> Any:
-        """個別の値を適切な型に変換"""
-        # 空文字列の処理
-        if value == "" or value is None:
-            if not parsed_field.required:
-                return None
-            return value  # Pydanticにバリデーションエラーを出させる
+    def _construct_trusted(self, form_data: dict[str, Any]) -> BaseModel | None:
+        """バリデーションを省略してモデルを構築
 
-        field_type = parsed_field.field_type
+        変換できない値や欠けている必須フィールド、バリデーションを省略できない型の
+        フィールドがある場合はNoneを返す
+        """
+        converters = self._trusted_converters
+        if converters is None:
+            return None
+        converted: dict[str, Any] = {}
 
-        try:
-            if field_type == FieldType.INTEGER:
-                return int(value)
-
-            elif field_type == FieldType.FLOAT:
-                return float(value)
-
-            elif field_type == FieldType.CHECKBOX or field_type == FieldType.BOOLEAN:
-                # チェックボックスは "on", "true", "1" などで送信される
-                if isinstance(value, bool):
-                    return value
-                if isinstance(value, str):
-                    return value.lower() in ("on", "true", "1", "yes", "checked")
-                return bool(value)
-
-            elif field_type == FieldType.DATE:
-                if isinstance(value, date):
-                    return value
-                if isinstance(value, str):
-                    # ISO形式の日付文字列をパース
-                    return date.fromisoformat(value)
-
-            elif field_type == FieldType.SELECT:
-                # 選択肢はそのまま文字列として返す
-                return str(value)
-
-            elif field_type == FieldType.STRING:
-                return str(value)
+        for field_name, parsed_field in self._field_items:
+            value = form_data.get(field_name, _MISSING)
+            if value is _MISSING:
+                if parsed_field.field_type is FieldType.CHECKBOX:
+                    converted[field_name] = False
+                elif parsed_field.required:
+                    return None
+                continue
 
-        except (ValueError, TypeError):
-            # 変換に失敗した場合は元の値を返し、Pydanticにバリデーションを任せる
-            return value
+            if value == "" or value is None:
+                if parsed_field.required:
+                    return None
+                converted[field_name] = None
+                continue
 
-        return value
+            try:
+                converted[field_name] = converters[field_name](value)
+            except (ValueError, TypeError):
+                return None
+
+        return self.model.model_construct(**converted)
 
     def _translate_error(self, error: dict[str, Any]) -> str:
         """Pydanticのエラーメッセージを日本語に翻訳"""
         error_type = error.get("type", "")
 
-        translations = {
-            "string_too_short": "この値は短すぎます",
-            "string_too_long": "この値は長すぎます",
-            "value_error": "値が無効です",
-            "type_error": "型が正しくありません",
-            "missing": "このフィールドは必須です",
-            "int_parsing": "整数を入力してください",
-            "float_parsing": "数値を入力してください",
-            "bool_parsing": "真偽値を入力してください",
-            "date_parsing": "有効な日付を入力してください",
-            "date_from_datetime_parsing": "有効な日付を入力してください",
-            "string_pattern_mismatch": "パターンに一致しません",
-            "greater_than_equal": f'この値は{error.get("ctx", {}).get("ge", "")}以上である必要があります',
-            "less_than_equal": f'この値は{error.get("ctx", {}).get("le", "")}以下である必要があります',
-            "greater_than": f'この値は{error.get("ctx", {}).get("gt", "")}より大きい必要があります',
-            "less_than": f'この値は{error.get("ctx", {}).get("lt", "")}より小さい必要があります',
-        }
+        message = _STATIC_TRANSLATIONS.get(error_type)
+        if message is not None:
+            return message
 
-        if error_type in translations:
-            return translations[error_type]
+        # 制約値を含むメッセージは該当する場合のみ組み立てる
+        bound = _BOUND_TRANSLATIONS.get(error_type)
+        if bound is not None:
+            key, formatter = bound
+            ctx = error.get("ctx")
+            return formatter(ctx.get(key, "") if ctx else "")
 
         return error.get("msg", "入力エラーです")
 
 
+# _get_parserのパーサーを保持するモデルクラスの属性名
+# （get_validatorと同様に、動的に生成されたモデルがパーサーとともに解放されるようにする）
+_PARSER_ATTR = "__pydantic_htmx_form_data_parser__"
+
+
+def _get_parser(model: type[BaseModel]) -> FormDataParser:
+    """モデルクラスごとのFormDataParserを取得
+
+    モデルクラスは定義後に変化しないため、キャッシュの無効化は不要
+    """
+    # サブクラスが親クラスのパーサーを引き継がないよう、クラス自身の属性のみを見る
+    parser = model.__dict__.get(_PARSER_ATTR)
+    if parser is None:
+        parser = FormDataParser(model)
+        setattr(model, _PARSER_ATTR, parser)
+    return parser
+
+
 def parse_form_data(model: type[BaseModel], form_data: dict[str, Any]) -> BaseModel:
     """
     フォームデータをPydanticモデルに変換するヘルパー関数
@@ -183,8 +451,7 @@ def parse_form_data(model: type[BaseModel], form_data: dict[str, Any]) -> BaseMo
         print(user.age)       # 25 (int型に変換される)
         ```
     """
-    parser = FormDataParser(model)
-    return parser.parse(form_data)
+    return _get_parser(model).parse(form_data)
 
 
 def parse_form_data_safe(
@@ -219,5 +486,4 @@ def parse_form_data_safe(
             # {'username': 'この値は短すぎます', 'age': 'この値は18以上である必要があります'}
         ```
     """
-    parser = FormDataParser(model)
-    return parser.parse_safe(form_data)
+    return _get_parser(model).parse_safe(form_data)
@@ -3,102 +3,17 @@
 Pydanticモデルを受け取ってHTMXフォームを生成
 """
 
+from functools import lru_cache
 from typing import Literal
 from pydantic import BaseModel
 
-from .parser import ModelParser, ParsedField
+from .parser import FieldList, ModelParser
 from .templates import TemplateRenderer
-from .validators import HTMXValidator
+from .validators import HTMXValidator, get_validator
 
 
-class FormGenerator:
-    """PydanticモデルからHTMXフォームを生成するメインクラス"""
-
-    def __init__(
-        self,
-        model: type[BaseModel],
-        validate_endpoint: str = "/validate",
-    ):
-        """
-        Args:
-            model: Pydanticモデルクラス
-            validate_endpoint: バリデーションエンドポイントのベースURL
-        """
-        self.model = model
-        self.validate_endpoint = validate_endpoint
-        self.fields = ModelParser.parse(model)
-        self.renderer = TemplateRenderer(validate_endpoint)
-        self.validator = HTMXValidator(model)
-
-    def generate_form(
-        self,
-        form_id: str | None = None,
-        action: str = "/submit",
-        target: str = "#response",
-        swap: Literal[
-            "innerHTML",
-            "outerHTML",
-            "beforeend",
-            "afterend",
-            "beforebegin",
-            "afterbegin",
-            "delete",
-            "none",
-        ] = "innerHTML",
-        submit_text: str = "送信",
-    ) -> str:
-        """
-        HTMLフォームを生成
-
-        Args:
-            form_id: フォームのID（デフォルトはモデル名から生成）
-            action: フォーム送信先のURL
-            target: HTMXのターゲットセレクタ
-            swap: HTMXのスワップ方式
-            submit_text: 送信ボタンのテキスト
-
-        Returns:
-            生成されたHTMLフォーム文字列
-        """
-        if form_id is None:
-            form_id = f"{self.model.__name__.lower()}-form"
-
-        return self.renderer.render_form(
-            fields=self.fields,
-            form_id=form_id,
-            action=action,
-            target=target,
-            swap=swap,
-            submit_text=submit_text,
-        )
-
-    def generate_field(self, field_name: str) -> str:
-        """
-        個別のフィールドHTMLを生成
-
-        Args:
-            field_name: フィールド名
-
-        Returns:
-            生成されたHTMLフィールド文字列
-        """
-        for field in self.fields:
-            if field.name == field_name:
-                return self.renderer.render_field(field)
-
-        raise ValueError(f"フィールドが見つかりません: {field_name}")
-
-    def get_fields(self) -> list[ParsedField]:
-        """解析されたフィールド情報を取得"""
-        return self.fields
-
-    def get_validator(self) -> HTMXValidator:
-        """バリデーターを取得"""
-        return self.validator
-
-    def generate_css(self) -> str:
-        """基本的なスタイルシートを生成"""
-        return """<style>
+# 基本スタイルシート（generate_cssで返す固定文字列）
+_DEFAULT_CSS = """<style>
 .pydantic-htmx-form {
   max-width: 500px;
   margin: 0 auto;
@@ -194,6 +109,137 @@ class FormGenerator:
 }
 </style>"""
 
+_HTMX_SCRIPT = '<script src="https://unpkg.com/htmx.org@2.0.4"></script>'
+
+# generate_full_htmlの固定部分
+_HTML_HEAD_OPEN = """<!DOCTYPE html>
+<html lang="ja">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>"""
+
+# スタイルシートはgenerate_cssの上書きを反映するため、呼び出し時に挟む
+_HTML_HEAD_CLOSE = """
+</head>
+<body>
+  <h1>"""
+
+_HTML_TAIL = """
+  <div id="response"></div>
+</body>
+</html>"""
+
+
+@lru_cache(maxsize=64)
+def _renderer_for(validate_endpoint: str) -> TemplateRenderer:
+    """エンドポイントごとのTemplateRendererを取得
+
+    TemplateRendererはエンドポイントとフィールドごとのHTMLのキャッシュ以外の状態を持たず、
+    キャッシュはフィールドのオブジェクト単位のため、同じエンドポイントを使うFormGenerator間で共有できる
+    （FormGeneratorはフィールドのコピーを持つため、インスタンスごとの変更は互いに影響しない）
+    """
+    return TemplateRenderer(validate_endpoint)
+
+
+class FormGenerator:
+    """PydanticモデルからHTMXフォームを生成するメインクラス"""
+
+    def __init__(
+        self,
+        model: type[BaseModel],
+        validate_endpoint: str = "/validate",
+    ):
+        """
+        Args:
+            model: Pydanticモデルクラス
+            validate_endpoint: バリデーションエンドポイントのベースURL
+        """
+        self.model = model
+        self.validate_endpoint = validate_endpoint
+        # 解析結果は共有され凍結されているため、インスタンスごとに変更可能なコピーを持つ
+        self.fields = ModelParser.parse(model).copy()
+        self.renderer = _renderer_for(validate_endpoint)
+        self._default_form_id = f"{model.__name__.lower()}-form"
+        self.validator = get_validator(model)
+
+    def generate_form(
+        self,
+        form_id: str | None = None,
+        action: str = "/submit",
+        target: str = "#response",
+        swap: Literal[
+            "innerHTML",
+            "outerHTML",
+            "beforeend",
+            "afterend",
+            "beforebegin",
+            "afterbegin",
+            "delete",
+            "none",
+        ] = "innerHTML",
+        submit_text: str = "送信",
+    ) -> str:
+        """
+        HTMLフォームを生成
+
+        Args:
+            form_id: フォームのID（デフォルトはモデル名から生成）
+            action: フォーム送信先のURL
+            target: HTMXのターゲットセレクタ
+            swap: HTMXのスワップ方式
+            submit_text: 送信ボタンのテキスト
+
+        Returns:
+            生成されたHTMLフォーム文字列
+        """
+        if form_id is None:
+            form_id = self._default_form_id
+
+        # フィールドのHTMLはレンダラーがキャッシュし、フィールドの変更時のみ再レンダリングする
+        return self.renderer.render_form(
+            self.fields,
+            form_id=form_id,
+            action=action,
+            target=target,
+            swap=swap,
+            submit_text=submit_text,
+        )
+
+    def generate_field(self, field_name: str) -> str:
+        """
+        個別のフィールドHTMLを生成
+
+        Args:
+            field_name: フィールド名
+
+        Returns:
+            生成されたHTMLフィールド文字列
+        """
+        try:
+            field = self.fields[field_name]
+        except KeyError:
+            raise ValueError(f"フィールドが見つかりません: {field_name}") from None
+
+        return self.renderer.render_field(field)
+
+    def get_fields(self) -> FieldList:
+        """解析されたフィールド情報を取得
+
+        フィールド名でも参照できるタプル（FieldList）を返す（以前はlist）
+        フィールドの追加や削除はできないため、必要な場合はlist()で変換すること
+        各フィールドはこのFormGenerator専用のコピーで、変更しても他のインスタンスには影響しない
+        """
+        return self.fields
+
+    def get_validator(self) -> HTMXValidator:
+        """バリデーターを取得"""
+        return self.validator
+
+    def generate_css(self) -> str:
+        """基本的なスタイルシートを生成"""
+        return _DEFAULT_CSS
+
     def generate_full_html(
         self,
         title: str = "フォーム",
@@ -217,22 +263,25 @@ class FormGenerator:
         Returns:
             完全なHTMLドキュメント
         """
-        htmx_script = ""
-        if include_htmx:
-            htmx_script = '<script src="https://unpkg.com/htmx.org@2.0.4"></script>'
-
-        return f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{title}</title>
-  {htmx_script}
-  {self.generate_css()}
-</head>
-<body>
-  <h1>{title}</h1>
-  {self.generate_form(form_id=form_id, action=action, target=target, submit_text=submit_text)}
-  <div id="response"></div>
-</body>
-</html>"""
+        htmx_script = _HTMX_SCRIPT if include_htmx else ""
+
+        return "".join(
+            (
+                _HTML_HEAD_OPEN,
+                title,
+                "</title>\n  ",
+                htmx_script,
+                "\n  ",
+                self.generate_css(),
+                _HTML_HEAD_CLOSE,
+                title,
+                "</h1>\n  ",
+                self.generate_form(
+                    form_id=form_id,
+                    action=action,
+                    target=target,
+                    submit_text=submit_text,
+                ),
+                _HTML_TAIL,
+            )
+        )
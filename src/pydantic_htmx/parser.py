@@ -2,9 +2,12 @@
 Pydanticモデルを解析してフィールド情報を抽出するモジュール
 """
 
-from typing import Any, get_args, get_origin
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
+from types import UnionType
 from datetime import date
 from enum import Enum
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
@@ -24,7 +27,31 @@ class FieldType(Enum):
 
 
 class ParsedField:
-    """解析されたフィールド情報を保持するクラス"""
+    """解析されたフィールド情報を保持するクラス
+
+    ModelParser.parseが返すフィールドはモデルごとに共有されるため、凍結されており変更できない
+    変更する場合はcopy()で変更可能なコピーを作る
+    """
+
+    __slots__ = (
+        "name",
+        "field_type",
+        "required",
+        "title",
+        "description",
+        "default",
+        "min_length",
+        "max_length",
+        "ge",
+        "le",
+        "gt",
+        "lt",
+        "pattern",
+        "options",
+        "placeholder",
+        "_frozen",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -60,19 +87,185 @@ class ParsedField:
         self.options = options or []
         self.placeholder = placeholder
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                "共有されたParsedFieldは変更できません（copy()を使用してください）"
+            )
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                "共有されたParsedFieldは変更できません（copy()を使用してください）"
+            )
+        object.__delattr__(self, name)
+
+    def copy(self) -> "ParsedField":
+        """変更可能なコピーを作成（選択肢もそれぞれコピーする）"""
+        new = ParsedField.__new__(ParsedField)
+        for name in _FIELD_ATTRS:
+            object.__setattr__(new, name, getattr(self, name))
+        object.__setattr__(
+            new,
+            "options",
+            [SelectOption(option.value, option.label) for option in self.options],
+        )
+        return new
+
+    def _freeze(self) -> "ParsedField":
+        """変更できないようにする（選択肢もタプルにする）"""
+        object.__setattr__(self, "options", tuple(self.options))
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+
+# ParsedFieldのコピー対象の属性（_frozenや__weakref__などの内部の属性は含めない）
+_FIELD_ATTRS = tuple(name for name in ParsedField.__slots__ if not name.startswith("_"))
+
+
+# フィールドのメタデータから抽出する制約の属性名
+_CONSTRAINT_NAMES = ("min_length", "max_length", "ge", "le", "gt", "lt", "pattern")
+
+# 属性が存在しないことを表す番兵
+_MISSING = object()
+
+
+class FieldList(tuple):
+    """名前でも参照できる解析済みフィールドのタプル
+
+    fields["name"] のように文字列で参照すると、解析時のフィールドを名前の辞書から引く
+    （整数やスライスでの参照は通常のタプルと同じ）
+    変更できないため、キャッシュした同じインスタンスをコピーせずに共有できる
+    """
+
+    # タプルのサブクラスは空でない__slots__を持てないため、_by_nameは__dict__に置く
+    _by_name: dict[str, ParsedField]
+
+    def __new__(
+        cls,
+        fields: Any = (),
+        by_name: dict[str, ParsedField] | None = None,
+    ) -> "FieldList":
+        self = super().__new__(cls, fields)
+        self._by_name = by_name if by_name is not None else {f.name: f for f in self}
+        return self
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            return self._by_name[key]
+        return super().__getitem__(key)
+
+    def copy(self) -> "FieldList":
+        """各フィールドを変更可能なコピーに置き換えたFieldListを作成"""
+        return FieldList(field.copy() for field in self)
+
+
+# モデルクラス → 解析済みフィールド
+# 動的に生成されたモデルが解放されるようにキーは弱参照で持つ
+_PARSE_CACHE: WeakKeyDictionary[type[BaseModel], FieldList] = WeakKeyDictionary()
+
+
+def _cached_by_annotation(func: Any, annotation: Any) -> Any:
+    """アノテーションをキーにキャッシュされた関数を呼び出す
+
+    ハッシュできないアノテーションの場合はキャッシュを使わずに呼び出す
+    """
+    try:
+        return func(annotation)
+    except TypeError:
+        return func.__wrapped__(annotation)
+
+
+# 基本型 → フィールドタイプ（サブクラスは一致させず、型そのものだけを引く）
+_BASIC_FIELD_TYPES: dict[type, FieldType] = {
+    bool: FieldType.CHECKBOX,
+    int: FieldType.INTEGER,
+    float: FieldType.FLOAT,
+    date: FieldType.DATE,
+    str: FieldType.STRING,
+}
+
+
+@lru_cache(maxsize=512)
+def _detect_from_annotation(annotation: Any) -> FieldType:
+    """型アノテーションからフィールドタイプを判定"""
+    # Annotatedの場合のみ、内部の型を取得
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        args = get_args(annotation)
+        if args:
+            annotation = args[0]
+            # 再度originを更新
+            origin = get_origin(annotation)
+
+    # Union型（T | None など）の場合、Noneでない型を取得
+    if origin is Union or isinstance(annotation, UnionType):
+        args = get_args(annotation)
+        non_none_args = [a for a in args if a is not type(None)]
+        if non_none_args:
+            annotation = non_none_args[0]
+            origin = get_origin(annotation)
+
+    # Literal型の検出（選択肢として扱う）
+    if origin is Literal:
+        return FieldType.SELECT
+
+    # SelectFieldの検出
+    if hasattr(annotation, "_select_field") or hasattr(annotation, "_options"):
+        return FieldType.SELECT
+
+    # 基本型の判定（該当しなければ文字列）
+    if isinstance(annotation, type):
+        return _BASIC_FIELD_TYPES.get(annotation, FieldType.STRING)
+    return FieldType.STRING
+
+
+@lru_cache(maxsize=512)
+def _options_from_annotation(annotation: Any) -> tuple[SelectOption, ...]:
+    """型アノテーションから選択肢を抽出"""
+    options: list[SelectOption] = []
+
+    # Annotatedの場合のみ、内部の型を取得
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        args = get_args(annotation)
+        if args:
+            annotation = args[0]
+            origin = get_origin(annotation)
+
+    if hasattr(annotation, "_options"):
+        return tuple(annotation._options)
+
+    # Literal型から抽出
+    if origin is Literal:
+        args = get_args(annotation)
+        for arg in args:
+            options.append(SelectOption(str(arg), str(arg)))
+
+    return tuple(options)
+
 
 class ModelParser:
     """Pydanticモデルを解析するクラス"""
 
     @classmethod
-    def parse(cls, model: type[BaseModel]) -> list[ParsedField]:
-        """Pydanticモデルからフィールド情報を抽出"""
-        fields: list[ParsedField] = []
-
-        for field_name, field_info in model.model_fields.items():
-            parsed = cls._parse_field(field_name, field_info)
-            fields.append(parsed)
-
+    def parse(cls, model: type[BaseModel]) -> FieldList:
+        """Pydanticモデルからフィールド情報を抽出
+
+        解析結果はモデルクラスごとにキャッシュされ、同じタプルがそのまま返される
+        返すタプルはフィールド名でも参照できる（fields["name"]）
+        各フィールドは共有されるため凍結されている（変更する場合はcopy()を使う）
+        """
+        cached = _PARSE_CACHE.get(model)
+        if cached is not None:
+            return cached
+
+        fields = FieldList(
+            cls._parse_field(field_name, field_info)._freeze()
+            for field_name, field_info in model.model_fields.items()
+        )
+        _PARSE_CACHE[model] = fields
         return fields
 
     @classmethod
@@ -106,50 +299,7 @@ class ModelParser:
     @classmethod
     def _detect_field_type(cls, annotation: Any, field_info: FieldInfo) -> FieldType:
         """型アノテーションからフィールドタイプを判定"""
-        from typing import Literal, Annotated, Union
-        from types import UnionType
-
-        original_annotation = annotation
-
-        # Annotatedの場合のみ、内部の型を取得
-        origin = get_origin(annotation)
-        if origin is Annotated:
-            args = get_args(annotation)
-            if args:
-                annotation = args[0]
-                # 再度originを更新
-                origin = get_origin(annotation)
-
-        # Union型（T | None など）の場合、Noneでない型を取得
-        if origin is Union or isinstance(annotation, UnionType):
-            args = get_args(annotation)
-            non_none_args = [a for a in args if a is not type(None)]
-            if non_none_args:
-                annotation = non_none_args[0]
-                origin = get_origin(annotation)
-
-        # Literal型の検出（選択肢として扱う）
-        if origin is Literal:
-            return FieldType.SELECT
-
-        # SelectFieldの検出
-        if hasattr(annotation, "_select_field") or hasattr(annotation, "_options"):
-            return FieldType.SELECT
-
-        # 基本型の判定
-        if annotation is bool:
-            return FieldType.CHECKBOX
-        if annotation is int:
-            return FieldType.INTEGER
-        if annotation is float:
-            return FieldType.FLOAT
-        if annotation is date:
-            return FieldType.DATE
-        if annotation is str:
-            return FieldType.STRING
-
-        # デフォルトは文字列
-        return FieldType.STRING
+        return _cached_by_annotation(_detect_from_annotation, annotation)
 
     @classmethod
     def _extract_constraints(cls, field_info: FieldInfo) -> dict[str, Any]:
@@ -158,20 +308,10 @@ class ModelParser:
 
         # メタデータから制約を取得
         for meta in field_info.metadata:
-            if hasattr(meta, "min_length"):
-                constraints["min_length"] = meta.min_length
-            if hasattr(meta, "max_length"):
-                constraints["max_length"] = meta.max_length
-            if hasattr(meta, "ge"):
-                constraints["ge"] = meta.ge
-            if hasattr(meta, "le"):
-                constraints["le"] = meta.le
-            if hasattr(meta, "gt"):
-                constraints["gt"] = meta.gt
-            if hasattr(meta, "lt"):
-                constraints["lt"] = meta.lt
-            if hasattr(meta, "pattern"):
-                constraints["pattern"] = meta.pattern
+            for name in _CONSTRAINT_NAMES:
+                value = getattr(meta, name, _MISSING)
+                if value is not _MISSING:
+                    constraints[name] = value
 
         return constraints
 
@@ -180,28 +320,11 @@ class ModelParser:
         cls, annotation: Any, field_info: FieldInfo
     ) -> list[SelectOption]:
         """選択肢を抽出"""
-        from typing import Literal, Annotated
-
-        options: list[SelectOption] = []
-
-        # Annotatedの場合のみ、内部の型を取得
-        origin = get_origin(annotation)
-        if origin is Annotated:
-            args = get_args(annotation)
-            if args:
-                annotation = args[0]
-                origin = get_origin(annotation)
-
-        if hasattr(annotation, "_options"):
-            return list(annotation._options)
-
-        # Literal型から抽出
-        if origin is Literal:
-            args = get_args(annotation)
-            for arg in args:
-                options.append(SelectOption(str(arg), str(arg)))
-
-        return options
+        # 選択肢は同じアノテーションのモデル間で共有されるため、フィールドごとにコピーする
+        return [
+            SelectOption(opt.value, opt.label)
+            for opt in _cached_by_annotation(_options_from_annotation, annotation)
+        ]
 
     @classmethod
     def _extract_placeholder(cls, field_info: FieldInfo) -> str | None:
@@ -3,80 +3,505 @@ HTMXバリデーション機能
 Pydanticのバリデーションと連動したHTMXレスポンスを生成
 """
 
-from typing import Any
+import html
+import operator
+import re
+from datetime import date
+from functools import lru_cache
+from math import isfinite
+from types import UnionType
+from typing import Any, Callable, Iterable, Literal, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+import annotated_types
 from pydantic import BaseModel, ValidationError
 
 
+_object_setattr = object.__setattr__
+
+# エラータイプ → 日本語メッセージ
+_STATIC_TRANSLATIONS: dict[str, str] = {
+    "string_too_short": "この値は短すぎます",
+    "string_too_long": "この値は長すぎます",
+    "value_error": "値が無効です",
+    "type_error": "型が正しくありません",
+    "missing": "このフィールドは必須です",
+    "int_parsing": "整数を入力してください",
+    "float_parsing": "数値を入力してください",
+    "bool_parsing": "真偽値を入力してください",
+    "date_parsing": "有効な日付を入力してください",
+    "string_pattern_mismatch": "パターンに一致しません",
+}
+
+# エラータイプ → (ctxのキー, メッセージのフォーマッタ)
+_BOUND_TRANSLATIONS: dict[str, tuple[str, Callable[[Any], str]]] = {
+    "greater_than_equal": ("ge", "この値は{}以上である必要があります".format),
+    "less_than_equal": ("le", "この値は{}以下である必要があります".format),
+    "greater_than": ("gt", "この値は{}より大きい必要があります".format),
+    "less_than": ("lt", "この値は{}より小さい必要があります".format),
+}
+
+# 簡易チェックで扱える制約（メタデータの型 → 属性名）
+_FAST_CONSTRAINTS: dict[type, str] = {
+    annotated_types.MinLen: "min_length",
+    annotated_types.MaxLen: "max_length",
+    annotated_types.Ge: "ge",
+    annotated_types.Gt: "gt",
+    annotated_types.Le: "le",
+    annotated_types.Lt: "lt",
+}
+
+# 簡易チェックで数値として扱う文字列（それ以外の表記はPydanticに任せる）
+_INT_RE = re.compile(r"[+-]?[0-9]{1,18}")
+_FLOAT_RE = re.compile(r"[+-]?(?:[0-9]{1,18}(?:\.[0-9]*)?|\.[0-9]{1,18})")
+
+# 簡易チェックで真偽値として扱う文字列（小文字化後。Pydanticの解釈と同じ）
+_TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_STRINGS = frozenset({"0", "off", "f", "false", "n", "no"})
+
+# 簡易チェックで日付として扱う文字列（それ以外の表記はPydanticに任せる）
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+# 簡易チェックの結果を変えうるモデル設定（指定されていれば対象外）
+_FAST_CHECK_CONFIG_KEYS = (
+    "strict",
+    "str_strip_whitespace",
+    "str_to_lower",
+    "str_to_upper",
+    "str_min_length",
+    "str_max_length",
+)
+# 簡易チェックが前提とする値から変更されていてはならないモデル設定（設定名 → 前提の値）
+_FAST_CHECK_CONFIG_DEFAULTS: dict[str, Any] = {"allow_inf_nan": True}
+
+
+def _supports_fast_checks(model: type[BaseModel]) -> bool:
+    """モデルが簡易チェックの対象になるか
+
+    バリデーターや初期化後処理を持つモデルは、値の変換やエラーが
+    フィールドの型と制約だけでは決まらないため対象外とする
+    """
+    decorators = model.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return False
+    if model.__pydantic_post_init__ is not None:
+        return False
+    config = model.model_config
+    if any(config.get(key) for key in _FAST_CHECK_CONFIG_KEYS):
+        return False
+    return all(
+        config.get(key, default) == default
+        for key, default in _FAST_CHECK_CONFIG_DEFAULTS.items()
+    )
+
+
+def _field_core_schemas(model: type[BaseModel]) -> dict[str, Any] | None:
+    """モデルのコアスキーマからフィールドごとのスキーマを取得
+
+    構築できない場合や想定外の構造の場合はNoneを返す
+    """
+    if not model.__pydantic_complete__ and not model.model_rebuild(raise_errors=False):
+        return None
+    schema = model.__pydantic_core_schema__
+    if schema.get("type") == "definitions":
+        schema = schema["schema"]
+    if schema.get("type") != "model":
+        return None
+    fields_schema = schema["schema"]
+    if fields_schema.get("type") != "model-fields":
+        return None
+    return {name: field["schema"] for name, field in fields_schema["fields"].items()}
+
+
+def _uses_validation_info(schema: Any) -> bool:
+    """スキーマにValidationInfoを受け取るバリデーター関数が含まれるか
+
+    そうしたバリデーターはinfo.dataで他のフィールドの値を参照しうる
+    参照先を辿れないスキーマ（definition-ref）も含むものとみなす
+    """
+    if isinstance(schema, dict):
+        if schema.get("type") == "definition-ref":
+            return True
+        function = schema.get("function")
+        if isinstance(function, dict) and function.get("type") == "with-info":
+            return True
+        return any(_uses_validation_info(v) for v in schema.values())
+    if isinstance(schema, (list, tuple)):
+        return any(_uses_validation_info(v) for v in schema)
+    return False
+
+
+# 呼び出し時点の日付をダミー値とすることを表す番兵（日付はキャッシュできないため）
+_TODAY = object()
+
+
+@lru_cache(maxsize=512)
+def _dummy_value_for(annotation: Any) -> Any:
+    """型アノテーションからダミー値を生成
+
+    同じアノテーションは複数のモデルやバリデーターで繰り返し現れるため、
+    判定結果をアノテーション単位でキャッシュする
+    日付型には、使う時点でdate.today()に置き換える_TODAYを返す
+    """
+    # Union型（T | None など）の場合
+    origin = get_origin(annotation)
+    if origin is Union or isinstance(annotation, UnionType):
+        args = get_args(annotation)
+        non_none_args = [a for a in args if a is not type(None)]
+        if non_none_args:
+            annotation = non_none_args[0]
+            origin = get_origin(annotation)
+
+    # Literal型の場合、最初の値を返す
+    if origin is Literal:
+        args = get_args(annotation)
+        if args:
+            return args[0]
+
+    if annotation is str:
+        return "dummy"
+    if annotation is int:
+        return 0
+    if annotation is float:
+        return 0.0
+    if annotation is bool:
+        return False
+    if annotation is date:
+        return _TODAY
+
+    return "dummy"
+
+
+@lru_cache(maxsize=256)
+def _render_error(message: str) -> str:
+    """エラーメッセージのHTML
+
+    エラーメッセージは翻訳テーブル由来の限られた文字列が繰り返し現れるため、
+    エスケープ済みのHTMLをキャッシュする
+    """
+    return f'<span class="error">{html.escape(message)}</span>'
+
+
 class ValidationResult:
-    """バリデーション結果を保持するクラス"""
+    """バリデーション結果を保持するクラス
+
+    成功時のvalueにはバリデーション後の値（型変換済み）が入る
+    （他のフィールドのエラーでモデルが組み立てられなかった場合はNone）
+    値を持たない結果はリクエスト間で共有されるため、生成後は変更できない
+    """
+
+    # フィールドごと・リクエストごとに生成されるため、インスタンス辞書を持たせない
+    __slots__ = ("is_valid", "error_message", "value")
+
+    def __init__(
+        self, is_valid: bool, error_message: str | None = None, value: Any = None
+    ):
+        _object_setattr(self, "is_valid", is_valid)
+        _object_setattr(self, "error_message", error_message)
+        _object_setattr(self, "value", value)
 
-    def __init__(self, is_valid: bool, error_message: str | None = None):
-        self.is_valid = is_valid
-        self.error_message = error_message
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ValidationResultは変更できません")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ValidationResultは変更できません")
 
     def to_html(self) -> str:
         """HTML形式でエラーメッセージを返す"""
-        if self.is_valid:
-            return ""
-        if not self.error_message:
+        if self.is_valid or not self.error_message:
             return ""
-        return (
-            f'<span class="error">{self._escape_html(self.error_message)}</span>'
-        )
+        return _render_error(self.error_message)
+
+
+def _check_bool(value: Any) -> ValidationResult | None:
+    """制約のないboolフィールドの簡易チェック（判定できない値はNone）"""
+    if type(value) is bool:
+        return ValidationResult(True, value=value)
+    if type(value) is str and value.isascii():
+        lowered = value.lower()
+        if lowered in _TRUE_STRINGS:
+            return ValidationResult(True, value=True)
+        if lowered in _FALSE_STRINGS:
+            return ValidationResult(True, value=False)
+    return None
+
+
+def _check_date(value: Any) -> ValidationResult | None:
+    """制約のないdateフィールドの簡易チェック（判定できない値はNone）"""
+    if type(value) is date:
+        return ValidationResult(True, value=value)
+    if type(value) is str and _DATE_RE.fullmatch(value):
+        try:
+            return ValidationResult(True, value=date.fromisoformat(value))
+        except ValueError:
+            # 存在しない日付のエラーメッセージはPydanticに任せる
+            return None
+    return None
 
-    @staticmethod
-    def _escape_html(text: str) -> str:
-        """HTMLエスケープ"""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#x27;")
-        )
+
+# モデル → {HTMXValidatorのクラス → 前処理の結果}
+# （_get_dummy_valueを上書きしたサブクラスではダミー値が異なるため、クラスごとに持つ）
+# エラーメッセージはインスタンスの状態に依存しうるため含めず、簡易チェックはインスタンスごとに構築する
+_VALIDATOR_STATES: WeakKeyDictionary[type[BaseModel], dict[type, tuple[Any, ...]]] = (
+    WeakKeyDictionary()
+)
+
+# 値を持たない結果は使い回す（ValidationResultは変更できないため安全に共有できる）
+_RESULT_OK = ValidationResult(True)
+_RESULT_REQUIRED = ValidationResult(False, "このフィールドは必須です")
 
 
 class HTMXValidator:
-    """HTMXと連動したバリデーションを行うクラス"""
+    """HTMXと連動したバリデーションを行うクラス
+
+    インスタンスは生成後に状態を変更しないため、同じモデルに対しては
+    get_validatorで一つのインスタンスを共有できる
+    """
 
     def __init__(self, model: type[BaseModel]):
         self.model = model
+        self._fields = model.model_fields
+
+        # モデルから導く前処理の結果はモデル・クラスごとに共有する
+        states = _VALIDATOR_STATES.get(model)
+        if states is None:
+            states = _VALIDATOR_STATES[model] = {}
+        state = states.get(type(self))
+        if state is None:
+            state = states[type(self)] = self._build_state()
+        (
+            self._required_names,
+            self._dummy_defaults,
+            self._today_dummy_names,
+            field_flags,
+            fast_checks,
+            self._field_required,
+            self._empty_input_shortcut,
+        ) = state
+
+        # フィールド名 → (必須か, Pydanticを呼ばずに判定できる場合の簡易チェック,
+        #                 validate_assignmentで単独にバリデートできるか)
+        # validate_fieldでのフィールド情報の参照を一度の辞書引きで済ませる
+        # （簡易チェックのエラーメッセージは_translate_errorで翻訳するため、インスタンスごとに作る）
+        fields = self._fields
+        build_fast_check = self._build_fast_check
+        self._field_meta: dict[
+            str, tuple[bool, Callable[[Any], ValidationResult | None] | None, bool]
+        ] = {
+            name: (
+                required,
+                build_fast_check(fields[name]) if fast_checks else None,
+                assignable,
+            )
+            for name, (required, assignable) in field_flags.items()
+        }
 
-    def _get_dummy_value(self, field_info: Any) -> Any:
-        """ダミー値を生成（必須フィールド用）"""
-        from datetime import date
-        from typing import get_origin, get_args, Literal, Union
-        from types import UnionType
+    def _build_state(self) -> tuple[Any, ...]:
+        """モデルのフィールド定義から前処理の結果を構築
 
-        annotation = field_info.annotation
+        結果は同じモデルの他のインスタンスと共有されるため、インスタンスを参照しない
+        """
+        model = self.model
+        fields = self._fields
+        required_names = frozenset(
+            name for name, info in fields.items() if info.is_required()
+        )
+        # validate_fieldで他の必須フィールドに補うダミー値
+        # （今日の日付を補うフィールドは、呼び出しごとに日付を求めるため分けて持つ）
+        dummy_defaults: dict[str, Any] = {}
+        today_dummy_names: list[str] = []
+        for name in fields:
+            if name in required_names:
+                dummy = self._get_dummy_value(fields[name])
+                if dummy is _TODAY:
+                    today_dummy_names.append(name)
+                else:
+                    dummy_defaults[name] = dummy
+        fast_checks = _supports_fast_checks(model)
+        assignable = (
+            fast_checks
+            and not model.__pydantic_root_model__
+            and not model.model_config.get("frozen")
+        )
+        # validate_assignmentでは他のフィールドの値がinfo.dataに入らないため、
+        # ValidationInfoを受け取るバリデーター（AfterValidatorなど）を持つフィールドは除く
+        field_schemas = _field_core_schemas(model) if assignable else None
+        if field_schemas is None:
+            assignable = False
+        # フィールド名 → (必須か, validate_assignmentで単独にバリデートできるか)
+        field_flags: dict[str, tuple[bool, bool]] = {
+            name: (
+                name in required_names,
+                assignable
+                and info.alias is None
+                and info.validation_alias is None
+                and not info.frozen
+                and not _uses_validation_info(field_schemas.get(name)),
+            )
+            for name, info in fields.items()
+        }
+        # 定義順の (フィールド名, 必須か)（validate_allでの走査用）
+        field_required = tuple((name, flags[0]) for name, flags in field_flags.items())
+        # 入力がすべて空の場合、必須フィールドのエラーだけで結果が決まるか
+        # （デフォルト値のバリデーションやモデルのバリデーターがあるとPydanticの判定が必要）
+        empty_input_shortcut = (
+            bool(required_names)
+            and fast_checks
+            and not model.model_config.get("validate_default")
+            and not any(info.validate_default for info in fields.values())
+        )
+        return (
+            required_names,
+            dummy_defaults,
+            tuple(today_dummy_names),
+            field_flags,
+            fast_checks,
+            field_required,
+            empty_input_shortcut,
+        )
 
-        # Union型（T | None など）の場合
-        origin = get_origin(annotation)
-        if origin is Union or isinstance(annotation, UnionType):
-            args = get_args(annotation)
-            non_none_args = [a for a in args if a is not type(None)]
-            if non_none_args:
-                annotation = non_none_args[0]
-                origin = get_origin(annotation)
-
-        # Literal型の場合、最初の値を返す
-        if origin is Literal:
-            args = get_args(annotation)
-            if args:
-                return args[0]
+    def _build_fast_check(
+        self, field_info: Any
+    ) -> Callable[[Any], ValidationResult | None] | None:
+        """単純な型と制約のみのフィールドに対する簡易チェックを構築
+
+        返す関数は判定できない値に対してNoneを返す（Pydanticでのバリデーションに任せる）
+        対象外のフィールドの場合はNoneを返す
+        """
+        annotation = field_info.annotation
+        if annotation not in (str, int, float, bool, date):
+            return None
+        if field_info.alias is not None or field_info.validation_alias is not None:
+            return None
+
+        bounds: dict[str, Any] = {}
+        for meta in field_info.metadata:
+            name = _FAST_CONSTRAINTS.get(type(meta))
+            if name is None or name in bounds:
+                return None
+            bounds[name] = getattr(meta, name)
+
+        if annotation is bool or annotation is date:
+            # 制約のないフィールドのみ、型の一致する値と明確な表記だけを判定する
+            if bounds:
+                return None
+            return _check_bool if annotation is bool else _check_date
+
+        translate = self._translate_error
+
+        # エラー結果は制約ごとに固定のため、構築時に一度だけ作る
+        # （返す関数がインスタンスを参照しないようにする）
+        def error(error_type: str, key: str, bound: Any) -> ValidationResult:
+            message = translate({"type": error_type, "ctx": {key: bound}})
+            return ValidationResult(False, message)
 
         if annotation is str:
-            return "dummy"
+            if bounds.keys() - {"min_length", "max_length"}:
+                return None
+            min_length = bounds.get("min_length")
+            max_length = bounds.get("max_length")
+            too_short = (
+                error("string_too_short", "min_length", min_length)
+                if min_length is not None
+                else None
+            )
+            too_long = (
+                error("string_too_long", "max_length", max_length)
+                if max_length is not None
+                else None
+            )
+
+            def check_str(value: Any) -> ValidationResult | None:
+                if type(value) is not str:
+                    return None
+                if min_length is not None and len(value) < min_length:
+                    return too_short
+                if max_length is not None and len(value) > max_length:
+                    return too_long
+                return ValidationResult(True, value=value)
+
+            return check_str
+
+        if bounds.keys() & {"min_length", "max_length"}:
+            return None
+        if ("ge" in bounds and "gt" in bounds) or ("le" in bounds and "lt" in bounds):
+            return None
+
         if annotation is int:
-            return 0
-        if annotation is float:
-            return 0.0
-        if annotation is bool:
-            return False
-        if annotation is date:
-            return date.today()
+            if any(type(b) is not int for b in bounds.values()):
+                return None
+            number_re = _INT_RE
+            number_types: tuple[type, ...] = (int,)
+        else:
+            # floatフィールドの制約値はfloatとしてエラーメッセージに含まれる
+            if any(type(b) not in (int, float) for b in bounds.values()):
+                return None
+            bounds = {k: float(b) for k, b in bounds.items()}
+            number_re = _FLOAT_RE
+            number_types = (int, float)
+        convert = annotation
+
+        # (比較関数, 制約値, 違反時の結果) の下限・上限
+        lower = upper = None
+        if "ge" in bounds:
+            lower = (
+                operator.ge,
+                bounds["ge"],
+                error("greater_than_equal", "ge", bounds["ge"]),
+            )
+        elif "gt" in bounds:
+            lower = (
+                operator.gt,
+                bounds["gt"],
+                error("greater_than", "gt", bounds["gt"]),
+            )
+        if "le" in bounds:
+            upper = (
+                operator.le,
+                bounds["le"],
+                error("less_than_equal", "le", bounds["le"]),
+            )
+        elif "lt" in bounds:
+            upper = (operator.lt, bounds["lt"], error("less_than", "lt", bounds["lt"]))
+
+        def check_number(value: Any) -> ValidationResult | None:
+            if type(value) in number_types:
+                # inf・NaNの扱いはallow_inf_nanと制約の組み合わせによるためPydanticに任せる
+                if type(value) is float and not isfinite(value):
+                    return None
+                number = value
+            elif type(value) is str and number_re.fullmatch(value):
+                number = convert(value)
+            else:
+                return None
+
+            failed = None
+            if lower is not None and not lower[0](number, lower[1]):
+                failed = lower
+            if upper is not None and not upper[0](number, upper[1]):
+                if failed is not None:
+                    # 上下限の両方に違反する場合のエラーの優先順位はPydanticに任せる
+                    return None
+                failed = upper
+            if failed is None:
+                return ValidationResult(True, value=convert(number))
+            return failed[2]
+
+        return check_number
 
-        return "dummy"
+    def _get_dummy_value(self, field_info: Any) -> Any:
+        """ダミー値を生成（必須フィールド用。日付型には_TODAYを返す）"""
+        annotation = field_info.annotation
+        try:
+            return _dummy_value_for(annotation)
+        except TypeError:
+            # ハッシュできないアノテーションはキャッシュせずに判定する
+            return _dummy_value_for.__wrapped__(annotation)
 
     def validate_field(self, field_name: str, data: dict[str, Any]) -> ValidationResult:
         """単一フィールドのバリデーション
@@ -87,32 +512,44 @@ class HTMXValidator:
             field_name: バリデーション対象のフィールド名
             data: フォーム全体のデータ
         """
-        if field_name not in self.model.model_fields:
+        meta = self._field_meta.get(field_name)
+        if meta is None:
             return ValidationResult(False, f"不明なフィールド: {field_name}")
 
-        field_info = self.model.model_fields[field_name]
+        required, fast_check, assignable = meta
         value = data.get(field_name)
 
-        # 必須チェック
-        if field_info.is_required() and (value is None or value == ""):
-            return ValidationResult(False, "このフィールドは必須です")
+        # 空値は必須ならエラー、必須でなければOK
+        if value is None or value == "":
+            if required:
+                return _RESULT_REQUIRED
+            return _RESULT_OK
 
-        # 空値で必須でない場合はOK
-        if not field_info.is_required() and (value is None or value == ""):
-            return ValidationResult(True)
+        # 単純なフィールドはPydanticを呼ばずに判定する
+        if fast_check is not None:
+            result = fast_check(value)
+            if result is not None:
+                return result
+
+        # 他のフィールドに依存しないフィールドは、そのフィールドのスキーマのみでバリデートする
+        if assignable:
+            return self._validate_assignment(field_name, value)
 
         # モデル全体をバリデートして対象フィールドのエラーを抽出
-        # 他の必須フィールドにダミー値を設定
-        validation_data = {}
-        for name, info in self.model.model_fields.items():
-            if name in data and data[name] not in (None, ""):
-                validation_data[name] = data[name]
-            elif info.is_required():
-                validation_data[name] = self._get_dummy_value(info)
+        # 入力のない必須フィールドにはダミー値を設定
+        fields = self._fields
+        validation_data = {
+            **self._dummy_data(),
+            **{
+                name: v
+                for name, v in data.items()
+                if name in fields and v is not None and v != ""
+            },
+        }
 
         try:
-            self.model.model_validate(validation_data)
-            return ValidationResult(True)
+            model = self.model.__pydantic_validator__.validate_python(validation_data)
+            return ValidationResult(True, value=getattr(model, field_name))
 
         except ValidationError as e:
             # 対象フィールドのエラーのみ抽出
@@ -121,68 +558,215 @@ class HTMXValidator:
                 if loc and str(loc[0]) == field_name:
                     return ValidationResult(False, self._translate_error(error))
 
-            return ValidationResult(True)
+            return _RESULT_OK
+
+    def _dummy_data(self) -> dict[str, Any]:
+        """必須フィールドのダミー値（日付型には呼び出し時点の日付を補う）"""
+        dummies = self._dummy_defaults
+        if self._today_dummy_names:
+            dummies = {
+                **dummies,
+                **dict.fromkeys(self._today_dummy_names, date.today()),
+            }
+        return dummies
+
+    def _validate_assignment(self, field_name: str, value: Any) -> ValidationResult:
+        """モデルのバリデーターのvalidate_assignmentで単一フィールドをバリデート
+
+        モデル全体をバリデートする場合と異なり、コストがフィールド数に依存しない
+        """
+        model = self.model
+        # 代入先の空のインスタンス（model_constructと異なりデフォルト値を評価しない）
+        instance = model.__new__(model)
+        _object_setattr(instance, "__dict__", {})
+        _object_setattr(instance, "__pydantic_fields_set__", set())
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+
+        try:
+            model.__pydantic_validator__.validate_assignment(
+                instance, field_name, value
+            )
+        except ValidationError as e:
+            for error in e.errors():
+                loc = error.get("loc", ())
+                if loc and str(loc[0]) == field_name:
+                    return ValidationResult(False, self._translate_error(error))
+            return _RESULT_OK
+
+        return ValidationResult(True, value=instance.__dict__[field_name])
 
     def validate_all(self, data: dict[str, Any]) -> dict[str, ValidationResult]:
-        """全フィールドのバリデーション"""
-        results: dict[str, ValidationResult] = {}
+        """全フィールドのバリデーション
 
-        # 各フィールドを個別にバリデート
-        for field_name in self.model.model_fields:
-            results[field_name] = self.validate_field(field_name, data)
+        モデル全体を一度だけバリデートし、エラーを各フィールドに振り分ける
+        """
+        return self._validate_once(data)[1]
 
-        return results
+    def validate_changed(
+        self, data: dict[str, Any], fields: Iterable[str]
+    ) -> dict[str, ValidationResult]:
+        """変更されたフィールドのみのバリデーション
+
+        HTMXの部分バリデーションのように一部のフィールドだけを確認する場合に使う
+        """
+        validate_field = self.validate_field
+        return {name: validate_field(name, data) for name in fields}
 
     def validate_and_parse(
         self, data: dict[str, Any]
     ) -> tuple[BaseModel | None, dict[str, ValidationResult]]:
         """バリデーションしてパースしたモデルを返す"""
-        results = self.validate_all(data)
+        model, results, complete = self._validate_once(data)
 
         # すべて成功したら解析されたモデルを返す
         if all(r.is_valid for r in results.values()):
+            # 入力がそのままバリデートされていれば、その結果のモデルを使う
+            if complete:
+                return model, results
             try:
-                model = self.model.model_validate(data)
+                model = self.model.__pydantic_validator__.validate_python(data)
                 return model, results
             except ValidationError:
                 pass
 
         return None, results
 
+    def _validate_once(
+        self, data: dict[str, Any]
+    ) -> tuple[BaseModel | None, dict[str, ValidationResult], bool]:
+        """モデル全体を一度だけバリデート
+
+        (バリデート済みのモデル, フィールドごとの結果, 入力全体をそのままバリデートしたか)
+        を返す。空値を除いた場合やモデル外のキーがある場合、3番目の値はFalseになる
+        入力のない必須フィールドには、info.dataで参照するバリデーターのために
+        validate_fieldと同じダミー値を補い、そのエラーは捨てる
+        （その場合に返すモデルはダミー値を含む）
+        """
+        errors: dict[str, ValidationResult] = {}
+        validation_data: dict[str, Any] = {}
+
+        data_get = data.get
+        for name, required in self._field_required:
+            value = data_get(name)
+            if value is None or value == "":
+                # 空値は必須ならエラー、必須でなければOK（デフォルト値を使わせる）
+                if required:
+                    errors[name] = _RESULT_REQUIRED
+                continue
+            validation_data[name] = value
+
+        complete = len(validation_data) == len(data)
+        model = None
+        # 入力がすべて空で、必須フィールドのエラーだけで結果が決まる場合はPydanticを呼ばない
+        if validation_data or not self._empty_input_shortcut:
+            if errors:
+                # 必須エラーのフィールドは先にerrorsへ入っているため、
+                # ダミー値によるエラーは_collect_errorsで採用されない
+                dummies = self._dummy_data()
+                for name in errors:
+                    validation_data[name] = dummies[name]
+            try:
+                # model_validateのPythonレベルの引数処理を省き、スキーマのバリデーターを直接呼ぶ
+                model = self.model.__pydantic_validator__.validate_python(
+                    validation_data
+                )
+            except ValidationError as e:
+                self._collect_errors(e, errors)
+
+        return model, self._build_results(model, errors), complete
+
+    def validate_and_parse_json(
+        self, raw: str | bytes
+    ) -> tuple[BaseModel | None, dict[str, ValidationResult]]:
+        """JSONのリクエストボディをバリデーションしてパースしたモデルを返す
+
+        辞書を経由せずにPydanticのJSONパーサーで直接バリデートする
+        フォームデータと異なり、空文字列は未入力として扱わない
+        """
+        errors: dict[str, ValidationResult] = {}
+        model = None
+        try:
+            model = self.model.model_validate_json(raw)
+        except ValidationError as e:
+            self._collect_errors(e, errors)
+        return model, self._build_results(model, errors)
+
+    def _collect_errors(
+        self, exc: ValidationError, errors: dict[str, ValidationResult]
+    ) -> None:
+        """ValidationErrorのエラーを各フィールドに振り分ける"""
+        model_fields = self._fields
+        translate = self._translate_error
+        for error in exc.errors():
+            loc = error.get("loc", ())
+            if not loc:
+                continue
+            name = str(loc[0])
+            # 各フィールドの最初のエラーのみを採用
+            if name in model_fields and name not in errors:
+                errors[name] = ValidationResult(False, translate(error))
+
+    def _build_results(
+        self, model: BaseModel | None, errors: dict[str, ValidationResult]
+    ) -> dict[str, ValidationResult]:
+        """フィールドの定義順に結果をまとめる（エラーのないフィールドは成功）"""
+        errors_get = errors.get
+        if model is None:
+            return {name: errors_get(name) or _RESULT_OK for name in self._fields}
+        return {
+            name: errors_get(name) or ValidationResult(True, value=getattr(model, name))
+            for name in self._fields
+        }
+
     def generate_error_response(self, results: dict[str, ValidationResult]) -> str:
         """エラーレスポンスのHTMLを生成"""
-        errors = []
-        for field_name, result in results.items():
-            if not result.is_valid:
-                errors.append(f"<li>{field_name}: {result.error_message}</li>")
-
-        if not errors:
+        # エラーがない場合（大半のリクエスト）はリストを作らずに返す
+        if all(result.is_valid for result in results.values()):
             return '<div class="success">入力内容に問題はありません</div>'
 
-        return f'<div class="errors"><ul>{"".join(errors)}</ul></div>'
+        escape = html.escape
+        errors = [
+            f"<li>{field_name}: {escape(result.error_message or '')}</li>"
+            for field_name, result in results.items()
+            if not result.is_valid
+        ]
+        return '<div class="errors"><ul>' + "".join(errors) + "</ul></div>"
 
     def _translate_error(self, error: dict[str, Any]) -> str:
         """Pydanticのエラーメッセージを日本語に翻訳"""
         error_type = error.get("type", "")
 
-        translations = {
-            "string_too_short": "この値は短すぎます",
-            "string_too_long": "この値は長すぎます",
-            "value_error": "値が無効です",
-            "type_error": "型が正しくありません",
-            "missing": "このフィールドは必須です",
-            "int_parsing": "整数を入力してください",
-            "float_parsing": "数値を入力してください",
-            "bool_parsing": "真偽値を入力してください",
-            "date_parsing": "有効な日付を入力してください",
-            "string_pattern_mismatch": "パターンに一致しません",
-            "greater_than_equal": f'この値は{error.get("ctx", {}).get("ge", "")}以上である必要があります',
-            "less_than_equal": f'この値は{error.get("ctx", {}).get("le", "")}以下である必要があります',
-            "greater_than": f'この値は{error.get("ctx", {}).get("gt", "")}より大きい必要があります',
-            "less_than": f'この値は{error.get("ctx", {}).get("lt", "")}より小さい必要があります',
-        }
+        message = _STATIC_TRANSLATIONS.get(error_type)
+        if message is not None:
+            return message
 
-        if error_type in translations:
-            return translations[error_type]
+        # 制約値を含むメッセージは該当する場合のみ組み立てる
+        bound = _BOUND_TRANSLATIONS.get(error_type)
+        if bound is not None:
+            key, formatter = bound
+            ctx = error.get("ctx")
+            return formatter(ctx.get(key, "") if ctx else "")
 
         return error.get("msg", "入力エラーです")
+
+
+# get_validatorのバリデーターを保持するモデルクラスの属性名
+# バリデーターはモデルを参照するため、モデルをキーにした弱参照の辞書に入れてもモデルは解放されない
+# モデル自身に持たせれば、循環参照としてモデルと一緒に回収される
+_VALIDATOR_ATTR = "__pydantic_htmx_validator__"
+
+
+def get_validator(model: type[BaseModel]) -> HTMXValidator:
+    """モデルクラスごとのHTMXValidatorを取得
+
+    リクエストごとにHTMXValidatorを生成する代わりにこの関数を使うと、
+    モデルごとの前処理が一度だけで済む
+    （動的に生成されたモデルは、バリデーターとともに解放される）
+    """
+    # サブクラスが親クラスのバリデーターを引き継がないよう、クラス自身の属性のみを見る
+    validator = model.__dict__.get(_VALIDATOR_ATTR)
+    if validator is None:
+        validator = HTMXValidator(model)
+        setattr(model, _VALIDATOR_ATTR, validator)
+    return validator
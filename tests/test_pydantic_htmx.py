@@ -6,7 +6,7 @@ from datetime import date
 from typing import Literal, Annotated
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from pydantic_htmx import FormGenerator, SelectOption, HTMXValidator
 from pydantic_htmx.field_types import Select
@@ -14,7 +14,10 @@ from pydantic_htmx.parser import ModelParser, FieldType
 
 
 # テスト用モデル
+# スキーマの構築は最初のバリデーションまで遅延させる（遅延されたモデルの動作確認も兼ねる）
 class SimpleModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     name: Annotated[str, Field(min_length=1, title="名前")]
     age: int = Field(ge=0, title="年齢")
 
@@ -22,6 +25,8 @@ class SimpleModel(BaseModel):
 class FullModel(BaseModel):
     """全フィールドタイプを含むモデル"""
 
+    model_config = ConfigDict(defer_build=True)
+
     # 文字列
     username: Annotated[str, Field(min_length=3, max_length=20, title="ユーザー名")]
 
@@ -50,11 +55,11 @@ class TestModelParser:
 
         assert len(fields) == 2
 
-        name_field = next(f for f in fields if f.name == "name")
+        name_field = fields["name"]
         assert name_field.field_type == FieldType.STRING
         assert name_field.title == "名前"
 
-        age_field = next(f for f in fields if f.name == "age")
+        age_field = fields["age"]
         assert age_field.field_type == FieldType.INTEGER
         assert age_field.ge == 0
 
@@ -65,34 +70,60 @@ class TestModelParser:
         assert len(fields) == 6
 
         # 文字列フィールド
-        username = next(f for f in fields if f.name == "username")
+        username = fields["username"]
         assert username.field_type == FieldType.STRING
         assert username.min_length == 3
         assert username.max_length == 20
 
         # 整数フィールド
-        age = next(f for f in fields if f.name == "age")
+        age = fields["age"]
         assert age.field_type == FieldType.INTEGER
         assert age.ge == 18
         assert age.le == 120
 
         # 浮動小数点フィールド
-        score = next(f for f in fields if f.name == "score")
+        score = fields["score"]
         assert score.field_type == FieldType.FLOAT
 
         # 日付フィールド
-        birth_date = next(f for f in fields if f.name == "birth_date")
+        birth_date = fields["birth_date"]
         assert birth_date.field_type == FieldType.DATE
 
         # 選択肢フィールド
-        status = next(f for f in fields if f.name == "status")
+        status = fields["status"]
         assert status.field_type == FieldType.SELECT
         assert len(status.options) == 3
 
         # チェックボックスフィールド
-        is_admin = next(f for f in fields if f.name == "is_admin")
+        is_admin = fields["is_admin"]
         assert is_admin.field_type == FieldType.CHECKBOX
 
+    def test_parse_cached(self):
+        """解析結果はモデルクラスごとにキャッシュされ、変更できないタプルが共有される"""
+        first = ModelParser.parse(SimpleModel)
+        second = ModelParser.parse(SimpleModel)
+
+        assert first is second
+        assert isinstance(first, tuple)
+        assert first["name"] is first[0]
+
+    def test_parsed_fields_frozen(self):
+        """共有される解析結果は変更できず、copy()で変更可能なコピーを作れる"""
+        fields = ModelParser.parse(SimpleModel)
+
+        with pytest.raises(AttributeError):
+            fields["name"].default = "John"
+
+        copied = fields.copy()
+        copied["name"].default = "John"
+        assert copied["name"] is not fields["name"]
+        assert fields["name"].default is None
+
+        status = ModelParser.parse(FullModel)["status"].copy()
+        status.options[0].label = "変更"
+        assert ModelParser.parse(FullModel)["status"].options[0].label == "active"
+        assert not hasattr(status, "_frozen")
+
 
 class TestFormGenerator:
     """FormGeneratorのテスト"""
@@ -118,6 +149,38 @@ class TestFormGenerator:
         assert 'hx-post="/api/submit"' in html
         assert ">送信する</button>" in html
 
+    def test_generate_field(self):
+        """個別フィールド生成"""
+        generator = FormGenerator(SimpleModel)
+        html = generator.generate_field("age")
+
+        assert 'id="field-age"' in html
+        assert 'name="name"' not in html
+
+        with pytest.raises(ValueError):
+            generator.generate_field("unknown")
+
+    def test_generators_customised_independently(self):
+        """同じモデルのFormGeneratorごとにフィールドを変更できる"""
+        first = FormGenerator(SimpleModel)
+        second = FormGenerator(SimpleModel)
+        second.generate_form()
+
+        first.fields["name"].default = "Alice"
+        first.fields["age"].default = 30
+
+        assert 'value="Alice"' in first.generate_field("name")
+        assert 'value="30"' in first.generate_form()
+        assert 'value="Alice"' not in second.generate_field("name")
+        assert "value=" not in second.generate_form()
+        assert FormGenerator(SimpleModel).get_fields()["name"].default is None
+
+    def test_render_field_cached(self):
+        """フィールドのHTMLはキャッシュされる"""
+        generator = FormGenerator(SimpleModel)
+
+        assert generator.generate_field("name") is generator.generate_field("name")
+
     def test_generate_full_html(self):
         """完全なHTMLドキュメント生成"""
         generator = FormGenerator(SimpleModel)
@@ -127,6 +190,18 @@ class TestFormGenerator:
         assert "<title>テストフォーム</title>" in html
         assert "htmx.org" in html
 
+    def test_generate_full_html_uses_generate_css(self):
+        """generate_cssを上書きしたサブクラスのスタイルがHTMLに含まれる"""
+
+        class CustomGenerator(FormGenerator):
+            def generate_css(self) -> str:
+                return "<style>.custom {}</style>"
+
+        html = CustomGenerator(SimpleModel).generate_full_html()
+
+        assert "<style>.custom {}</style>" in html
+        assert ".pydantic-htmx-form {" not in html
+
     def test_generate_css(self):
         """CSS生成"""
         generator = FormGenerator(SimpleModel)
@@ -158,6 +233,22 @@ class TestHTMXValidator:
         assert not result.is_valid
         assert "短すぎます" in result.error_message
 
+    def test_validate_field_numeric_bounds(self):
+        """数値の制約違反のメッセージ"""
+        validator = HTMXValidator(FullModel)
+
+        result = validator.validate_field("age", {"age": "15"})
+        assert not result.is_valid
+        assert result.error_message == "この値は18以上である必要があります"
+
+        result = validator.validate_field("score", {"score": "100.5"})
+        assert not result.is_valid
+        assert result.error_message == "この値は100.0以下である必要があります"
+
+        result = validator.validate_field("age", {"age": "abc"})
+        assert not result.is_valid
+        assert result.error_message == "整数を入力してください"
+
     def test_validate_field_required(self):
         """必須フィールドのバリデーション"""
         validator = HTMXValidator(SimpleModel)
@@ -178,6 +269,62 @@ class TestHTMXValidator:
         results = validator.validate_all({"name": "", "age": -5})
         assert not results["name"].is_valid
         assert not results["age"].is_valid
+        assert results["age"].error_message == "この値は0以上である必要があります"
+
+    def test_get_validator_cached(self):
+        """get_validatorはモデルごとに同じバリデーターを返す"""
+        from pydantic_htmx import get_validator
+
+        assert get_validator(SimpleModel) is get_validator(SimpleModel)
+        assert FormGenerator(SimpleModel).get_validator() is get_validator(SimpleModel)
+
+    def test_get_validator_releases_model(self):
+        """get_validatorのキャッシュは動的に生成されたモデルの解放を妨げない"""
+        import gc
+        import weakref
+
+        from pydantic import create_model
+
+        from pydantic_htmx import get_validator
+
+        model = create_model("DynamicModel", name=(str, ...))
+        assert get_validator(model) is get_validator(model)
+        ref = weakref.ref(model)
+        del model
+        gc.collect()
+
+        assert ref() is None
+
+    def test_validator_state_shared_per_model(self):
+        """同じモデルのHTMXValidatorは前処理の結果を共有する"""
+        first = HTMXValidator(SimpleModel)
+        second = HTMXValidator(SimpleModel)
+
+        assert first._field_required is second._field_required
+        assert second.validate_field("age", {"age": "-1"}).error_message == (
+            "この値は0以上である必要があります"
+        )
+
+    def test_fast_check_messages_per_instance(self):
+        """簡易チェックのエラーメッセージはインスタンスごとの_translate_errorで翻訳される"""
+
+        class LocaleValidator(HTMXValidator):
+            def __init__(self, model, locale: str):
+                self.locale = locale
+                super().__init__(model)
+
+            def _translate_error(self, error):
+                return f"{self.locale}:{error['type']}"
+
+        ja = LocaleValidator(SimpleModel, "ja")
+        en = LocaleValidator(SimpleModel, "en")
+
+        assert ja.validate_field("age", {"age": "-1"}).error_message == (
+            "ja:greater_than_equal"
+        )
+        assert en.validate_field("age", {"age": "-1"}).error_message == (
+            "en:greater_than_equal"
+        )
 
     def test_validate_and_parse(self):
         """バリデーションとパース"""
@@ -193,6 +340,236 @@ class TestHTMXValidator:
         model, results = validator.validate_and_parse({"name": "", "age": -5})
         assert model is None
 
+    def test_validate_field_ignores_other_invalid_fields(self):
+        """他のフィールドが不正でも対象フィールドのみを判定する"""
+
+        class PatternModel(BaseModel):
+            code: str = Field(pattern=r"^[a-z]+$")
+            born: date
+            count: int = Field(ge=0)
+
+        validator = HTMXValidator(PatternModel)
+        data = {"code": "abc", "born": "2024-01-02", "count": "-1"}
+
+        assert validator.validate_field("code", data).value == "abc"
+        assert validator.validate_field("born", data).value == date(2024, 1, 2)
+        result = validator.validate_field("code", {**data, "code": "ABC"})
+        assert result.error_message == "パターンに一致しません"
+
+    def test_validate_and_parse_json(self):
+        """JSONのボディを直接バリデーションしてパース"""
+        validator = HTMXValidator(SimpleModel)
+
+        model, results = validator.validate_and_parse_json(
+            b'{"name": "John", "age": 25}'
+        )
+        assert model is not None
+        assert model.age == 25
+
+        model, results = validator.validate_and_parse_json(
+            b'{"name": "John", "age": -1}'
+        )
+        assert model is None
+        assert results["name"].is_valid
+        assert results["age"].error_message == "この値は0以上である必要があります"
+
+    def test_validate_field_unconstrained_bool_and_date(self):
+        """制約のないbool・dateフィールドの判定"""
+
+        class FlagModel(BaseModel):
+            agree: bool
+            since: date
+
+        validator = HTMXValidator(FlagModel)
+
+        assert validator.validate_field("agree", {"agree": "On"}).value is True
+        assert validator.validate_field("agree", {"agree": "no"}).value is False
+        assert not validator.validate_field("agree", {"agree": "maybe"}).is_valid
+        assert validator.validate_field("since", {"since": "2024-01-31"}).value == date(
+            2024, 1, 31
+        )
+        assert not validator.validate_field("since", {"since": "2024-02-30"}).is_valid
+
+    def test_validate_changed(self):
+        """validate_changedは指定したフィールドのみを返す"""
+        validator = HTMXValidator(SimpleModel)
+        results = validator.validate_changed({"name": "", "age": "-1"}, ["age"])
+
+        assert list(results) == ["age"]
+        assert not results["age"].is_valid
+
+    def test_validate_field_with_info_validator(self):
+        """info.dataで他のフィールドを参照するバリデーターにも入力値が渡される"""
+        from pydantic import AfterValidator, ValidationInfo
+
+        def match_password(value: str, info: ValidationInfo) -> str:
+            if value != info.data.get("password"):
+                raise ValueError("パスワードが一致しません")
+            return value
+
+        class PasswordModel(BaseModel):
+            password: str
+            confirm: Annotated[str, AfterValidator(match_password)]
+
+        validator = HTMXValidator(PasswordModel)
+        data = {"password": "abc", "confirm": "abc"}
+
+        assert validator.validate_field("confirm", data).is_valid
+        assert validator.validate_changed(data, ["confirm"])["confirm"].is_valid
+        assert not validator.validate_field(
+            "confirm", {"password": "abc", "confirm": "xyz"}
+        ).is_valid
+
+    def test_validate_field_allow_inf_nan(self):
+        """allow_inf_nan=Falseのモデルではinf・NaNがエラーになる"""
+
+        class FiniteModel(BaseModel):
+            model_config = ConfigDict(allow_inf_nan=False)
+            ratio: float = Field(ge=0)
+
+        validator = HTMXValidator(FiniteModel)
+
+        assert not validator.validate_field("ratio", {"ratio": float("inf")}).is_valid
+        assert not validator.validate_field("ratio", {"ratio": float("nan")}).is_valid
+        assert validator.validate_field("ratio", {"ratio": 1.5}).is_valid
+
+    def test_validate_field_date_dummy_uses_current_date(self, monkeypatch):
+        """日付フィールドのダミー値には呼び出し時点の日付が使われる"""
+        from pydantic import ValidationInfo, field_validator
+
+        import pydantic_htmx.validators as validators_module
+
+        class Booking(BaseModel):
+            start: date
+            end: date
+
+            @field_validator("end")
+            @classmethod
+            def after_start(cls, value: date, info: ValidationInfo) -> date:
+                if value < info.data["start"]:
+                    raise ValueError("開始日より前です")
+                return value
+
+        validator = HTMXValidator(Booking)
+        data = {"end": date.today().isoformat()}
+        assert validator.validate_field("end", data).is_valid
+
+        class Tomorrow(date):
+            @classmethod
+            def today(cls) -> date:
+                return date.fromordinal(date.today().toordinal() + 1)
+
+        monkeypatch.setattr(validators_module, "date", Tomorrow)
+        assert not validator.validate_field("end", data).is_valid
+
+    def test_validate_all_missing_field_with_info_validator(self):
+        """info.dataで参照されるフィールドが未入力でも、エラーの結果を返す"""
+        from pydantic import ValidationInfo, field_validator
+
+        class Booking(BaseModel):
+            start: date
+            end: date
+
+            @field_validator("end")
+            @classmethod
+            def after_start(cls, value: date, info: ValidationInfo) -> date:
+                if value < info.data["start"]:
+                    raise ValueError("開始日より前です")
+                return value
+
+        validator = HTMXValidator(Booking)
+        data = {"end": "2024-01-01"}
+        results = validator.validate_all(data)
+
+        assert results["start"].error_message == "このフィールドは必須です"
+        assert results["end"].error_message == "値が無効です"
+
+        model, results = validator.validate_and_parse(data)
+        assert model is None
+        assert not results["start"].is_valid
+
+    def test_validate_all_empty_input(self):
+        """入力がすべて空の場合は必須フィールドのみがエラーになる"""
+        validator = HTMXValidator(SimpleModel)
+        results = validator.validate_all({})
+
+        assert results["name"].error_message == "このフィールドは必須です"
+        assert results["age"].error_message == "このフィールドは必須です"
+
+    def test_validation_result_to_html(self):
+        """ValidationResult.to_htmlはエラー時のみエスケープ済みのHTMLを返す"""
+        from pydantic_htmx.validators import ValidationResult
+
+        assert ValidationResult(True).to_html() == ""
+        assert ValidationResult(False).to_html() == ""
+        assert (
+            ValidationResult(False, "<必須>").to_html()
+            == '<span class="error">&lt;必須&gt;</span>'
+        )
+
+    def test_generate_error_response_escapes_messages(self):
+        """エラーレスポンスのメッセージはHTMLエスケープされる"""
+        from pydantic_htmx.validators import ValidationResult
+
+        validator = HTMXValidator(SimpleModel)
+        html = validator.generate_error_response(
+            {
+                "name": ValidationResult(False, "<b>不正</b>"),
+                "age": ValidationResult(True),
+            }
+        )
+
+        assert (
+            html
+            == '<div class="errors"><ul><li>name: &lt;b&gt;不正&lt;/b&gt;</li></ul></div>'
+        )
+        assert "success" in validator.generate_error_response(
+            {"age": ValidationResult(True)}
+        )
+
+    def test_validation_result_value(self):
+        """成功したValidationResultは型変換後の値を持つ"""
+        validator = HTMXValidator(SimpleModel)
+
+        assert (
+            validator.validate_field("age", {"name": "John", "age": "25"}).value == 25
+        )
+        results = validator.validate_all({"name": "John", "age": "25"})
+        assert results["name"].value == "John"
+        assert results["age"].value == 25
+
+    def test_validation_result_immutable(self):
+        """共有される結果を含め、ValidationResultは変更できない"""
+        validator = HTMXValidator(SimpleModel)
+        result = validator.validate_field("name", {"name": ""})
+
+        with pytest.raises(AttributeError):
+            result.error_message = "Required"
+        assert validator.validate_field("name", {"name": ""}).error_message == (
+            "このフィールドは必須です"
+        )
+
+    def test_validate_and_parse_validates_once(self):
+        """入力がそのまま使える場合、validate_and_parseはモデルを一度だけバリデートする"""
+        from pydantic import model_validator
+
+        calls = []
+
+        class CountingModel(BaseModel):
+            name: str
+
+            @model_validator(mode="after")
+            def count(self):
+                calls.append(self.name)
+                return self
+
+        validator = HTMXValidator(CountingModel)
+        model, results = validator.validate_and_parse({"name": "John"})
+
+        assert model is not None
+        assert model.name == "John"
+        assert calls == ["John"]
+
 
 class TestSelectField:
     """選択肢フィールドのテスト"""
@@ -216,6 +593,37 @@ class TestSelectField:
         assert color_field.options[0].value == "red"
         assert color_field.options[0].label == "赤"
 
+    def test_select_type_reused(self):
+        """同じ選択肢からは同じ型が返される"""
+        assert Select(["S", "M"]) is Select(["S", "M"])
+        assert Select(["S", "M"]) is not Select(["S", "L"])
+
+    def test_select_options_not_shared(self):
+        """同じ選択肢のモデル間で、選択肢の変更が共有されない"""
+        option = SelectOption("red", "赤")
+
+        class First(BaseModel):
+            color: Select([option, "blue"])
+
+        class Second(BaseModel):
+            color: Select([SelectOption("red", "赤"), "blue"])
+
+        option.label = "変更"
+        First.model_fields["color"].annotation._select_field.options.clear()
+        ModelParser.parse(First)["color"].options[1].label = "変更"
+
+        assert ModelParser.parse(First)["color"].options[0].label == "赤"
+        assert FormGenerator(Second).fields["color"].options[0].label == "赤"
+        assert FormGenerator(Second).fields["color"].options[1].label == "blue"
+        assert 'value="red">赤' in FormGenerator(Second).generate_form()
+
+    def test_select_option_default_label(self):
+        """ラベル省略時は値がラベルになる"""
+        option = SelectOption("red")
+
+        assert option.label == "red"
+        assert option == SelectOption("red", "red")
+
     def test_select_with_strings(self):
         """文字列リストを使った選択肢"""
 
@@ -253,6 +661,85 @@ class TestHTMLOutput:
         assert 'hx-vals=\'{"_field": "name"}\'' in html
         assert 'hx-vals=\'{"_field": "age"}\'' in html
 
+    def test_generate_form_reflects_default_change(self):
+        """generate_formはdefaultの変更後に再生成したHTMLを返す"""
+        generator = FormGenerator(SimpleModel)
+        html = generator.generate_form()
+
+        generator.fields[0].default = "Alice"
+        assert generator.generate_form() != html
+        assert 'value="Alice"' in generator.generate_form()
+
+    def test_generate_reflects_attribute_change(self):
+        """レンダリング後にdefault以外の属性を変更しても再レンダリングされる"""
+        generator = FormGenerator(FullModel)
+        generator.generate_form()
+        generator.generate_field("age")
+
+        generator.get_fields()[0].title = "CHANGED"
+        generator.fields["age"].placeholder = "PH"
+        generator.fields["status"].options[0].label = "稼働中"
+
+        assert "CHANGED" in generator.generate_form()
+        assert 'placeholder="PH"' in generator.generate_field("age")
+        assert ">稼働中</option>" in generator.generate_field("status")
+
+    def test_generate_form_uses_renderer(self):
+        """generate_formはレンダラーのrender_formでフォームを生成する"""
+        from pydantic_htmx.templates import TemplateRenderer
+
+        class WrappingRenderer(TemplateRenderer):
+            def render_form(self, fields, **kwargs) -> str:
+                return "<div>" + super().render_form(fields, **kwargs) + "</div>"
+
+        generator = FormGenerator(SimpleModel)
+        generator.renderer = WrappingRenderer()
+        html = generator.generate_form()
+
+        assert html.startswith("<div><form")
+        assert 'id="simplemodel-form"' in html
+
+    def test_render_form_matches_generate_form(self):
+        """TemplateRenderer.render_formはgenerate_formと同じHTMLを返す"""
+        from pydantic_htmx.templates import TemplateRenderer
+
+        generator = FormGenerator(FullModel)
+        renderer = TemplateRenderer()
+
+        assert (
+            renderer.render_form(generator.get_fields(), form_id="fullmodel-form")
+            == generator.generate_form()
+        )
+
+    def test_render_form_iter(self):
+        """render_form_iterは開始タグ・各フィールド・終了部分を順に返す"""
+        from pydantic_htmx.templates import TemplateRenderer
+
+        fields = ModelParser.parse(SimpleModel)
+        renderer = TemplateRenderer()
+        chunks = list(renderer.render_form_iter(fields))
+
+        assert chunks[0].startswith("<form")
+        assert chunks[-1].endswith("</form>")
+        assert "".join(chunks) == renderer.render_form(fields)
+
+    def test_render_field_cache_per_renderer(self):
+        """HTMLはレンダラーごとにキャッシュされ、defaultの変更で再レンダリングされる"""
+        from pydantic_htmx.parser import ParsedField
+        from pydantic_htmx.templates import TemplateRenderer
+
+        class DataAttrRenderer(TemplateRenderer):
+            def _build_attrs(self, field: ParsedField) -> str:
+                return super()._build_attrs(field) + ' data-custom="1"'
+
+        field = ParsedField("nickname", FieldType.STRING, default="taro")
+        assert 'data-custom="1"' in DataAttrRenderer().render_field(field)
+
+        renderer = TemplateRenderer()
+        assert 'data-custom="1"' not in renderer.render_field(field)
+        field.default = "jiro"
+        assert 'value="jiro"' in renderer.render_field(field)
+
     def test_html_escaping(self):
         """HTMLエスケープの確認"""
 
@@ -266,6 +753,7 @@ class TestHTMLOutput:
 
         assert "&lt;script&gt;" in html
         assert "&amp;" in html
+        assert "&#x27;xss&#x27;" in html
 
 
 class TestFormDataParser:
@@ -344,6 +832,10 @@ class TestFormDataParser:
         model = parser.parse({"checked": "false"})
         assert model.checked is False
 
+        # 大文字小文字は区別しない
+        model = parser.parse({"checked": "CHECKED"})
+        assert model.checked is True
+
     def test_parse_safe_success(self):
         """parse_safeの成功ケース"""
         from pydantic_htmx import parse_form_data_safe
@@ -366,6 +858,62 @@ class TestFormDataParser:
         assert model is None
         assert "name" in errors
         assert "age" in errors
+        assert errors["age"] == "この値は0以上である必要があります"
+
+    def test_parse_safe_missing_required(self):
+        """parse_safeで必須フィールドが送信されていない場合"""
+        from pydantic_htmx import parse_form_data_safe
+
+        model, errors = parse_form_data_safe(SimpleModel, {"name": "John"})
+
+        assert model is None
+        assert errors == {"age": "このフィールドは必須です"}
+
+        # 送信された値の制約エラーも合わせて返す
+        model, errors = parse_form_data_safe(SimpleModel, {"age": "-5"})
+
+        assert model is None
+        assert errors == {
+            "name": "このフィールドは必須です",
+            "age": "この値は0以上である必要があります",
+        }
+
+    def test_parse_safe_missing_aliased(self):
+        """別名を持つフィールドのエラーは、送信内容によらず別名をキーにする"""
+        from pydantic_htmx import parse_form_data_safe
+
+        class AliasedModel(BaseModel):
+            user_name: str = Field(alias="userName")
+            age: int = Field(ge=0)
+
+        _, errors = parse_form_data_safe(AliasedModel, {})
+        assert errors == {
+            "userName": "このフィールドは必須です",
+            "age": "このフィールドは必須です",
+        }
+
+        _, errors = parse_form_data_safe(AliasedModel, {"age": "-1"})
+        assert set(errors) == {"userName", "age"}
+
+    def test_parse_safe_before_validator_fills_field(self):
+        """モデルのバリデーターが値を補う場合は、必須フィールドのエラーにならない"""
+        from pydantic import model_validator
+
+        from pydantic_htmx import parse_form_data_safe
+
+        class FilledModel(BaseModel):
+            a: int
+            b: str | None = None
+
+            @model_validator(mode="before")
+            @classmethod
+            def fill(cls, data):
+                return {"a": 1, **data}
+
+        model, errors = parse_form_data_safe(FilledModel, {})
+
+        assert errors == {}
+        assert model.a == 1
 
     def test_parse_optional_field(self):
         """オプショナルフィールドのパース"""
@@ -388,6 +936,108 @@ class TestFormDataParser:
 
         assert model.nickname == "Johnny"
 
+    def test_parse_invalid_date(self):
+        """日付として解釈できない文字列"""
+        from pydantic_htmx import parse_form_data_safe
+
+        form_data = {
+            "username": "john_doe",
+            "age": "25",
+            "score": "85.5",
+            "birth_date": "not-a-date",
+            "status": "active",
+        }
+        model, errors = parse_form_data_safe(FullModel, form_data)
+
+        assert model is None
+        assert "birth_date" in errors
+
+    def test_parse_trusted(self):
+        """trusted=Trueでの変換"""
+        from pydantic_htmx import FormDataParser
+
+        parser = FormDataParser(SimpleModel)
+
+        model = parser.parse({"name": "John", "age": "25"}, trusted=True)
+        assert model.name == "John"
+        assert model.age == 25
+
+        # 変換できない値がある場合は通常のバリデーションにフォールバックする
+        with pytest.raises(ValidationError):
+            parser.parse({"name": "John", "age": "abc"}, trusted=True)
+        with pytest.raises(ValidationError):
+            parser.parse({"name": "", "age": "25"}, trusted=True)
+
+    def test_parse_trusted_untyped_values(self):
+        """trusted=Trueでも型の異なる値や単純でない型のフィールドはバリデーションされる"""
+        from datetime import datetime
+
+        from pydantic_htmx import FormDataParser
+
+        class Inner(BaseModel):
+            z: int
+
+        class NestedModel(BaseModel):
+            tags: list[str]
+            inner: Inner
+
+        # 通常の変換と同じ結果になる（文字列化された値はバリデーションで拒否される）
+        parser = FormDataParser(NestedModel)
+        data = {"tags": ["a", "b"], "inner": {"z": 1}}
+        with pytest.raises(ValidationError):
+            parser.parse(data)
+        with pytest.raises(ValidationError):
+            parser.parse(data, trusted=True)
+
+        class DateModel(BaseModel):
+            when: date
+            count: int
+
+        parser = FormDataParser(DateModel)
+        with pytest.raises(ValidationError):
+            parser.parse({"when": datetime(2024, 1, 1, 5), "count": 1}, trusted=True)
+        data = {"when": "2024-01-01", "count": 1.5}
+        assert parser.parse(data, trusted=True) == parser.parse(data)
+
+    def test_parse_trusted_date(self):
+        """trusted=Trueでも日付に変換できない文字列はバリデーションされる"""
+        from pydantic_htmx import FormDataParser
+
+        class DateModel(BaseModel):
+            d: date
+
+        parser = FormDataParser(DateModel)
+
+        with pytest.raises(ValidationError):
+            parser.parse({"d": "not-a-date"}, trusted=True)
+        assert parser.parse({"d": "2024-01-01"}, trusted=True).d == date(2024, 1, 1)
+        # YYYY-MM-DD以外のISO形式も受け付ける
+        assert parser.parse({"d": "20240101"}, trusted=True).d == date(2024, 1, 1)
+        assert parser.parse({"d": "20240101"}).d == date(2024, 1, 1)
+
+    def test_parser_cached_per_model(self):
+        """ヘルパー関数はモデルごとにパーサーを再利用する"""
+        from pydantic_htmx.form_data import _get_parser
+
+        assert _get_parser(SimpleModel) is _get_parser(SimpleModel)
+
+    def test_parser_cache_releases_model(self):
+        """パーサーのキャッシュは動的に生成されたモデルの解放を妨げない"""
+        import gc
+        import weakref
+
+        from pydantic import create_model
+        from pydantic_htmx.form_data import _get_parser
+
+        model = create_model("DynamicModel", name=(str, ...))
+        assert _get_parser(model) is _get_parser(model)
+        ref = weakref.ref(model)
+        del model
+        gc.collect()
+
+        assert ref() is None
+        assert _get_parser(SimpleModel) is not _get_parser(FullModel)
+
 
 class TestFieldValidator:
     """field_validatorを含むモデルのバリデーションテスト"""